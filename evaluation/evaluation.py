@@ -126,28 +126,24 @@ class Evaluation:
         return int((-penalty - open_file_against_king_penalty) * pawn_shield_weight)
 
     def evaluate_pawns(self, colour_index: int, board: chess.Board) -> int:
-        # Fixed implementation to avoid KeyError
-        pawns = list(board.pieces(chess.PAWN, colour_index))
-        opponent_pawns = list(board.pieces(chess.PAWN, chess.WHITE if colour_index == chess.BLACK else chess.BLACK))
-        friendly_pawns = pawns  # For clarity
+        # Pawn structure is read straight off the bitboards with precomputed masks
+        friendly_pawns = board.pieces_mask(chess.PAWN, colour_index)
+        opponent_pawns = board.pieces_mask(chess.PAWN, not colour_index)
 
-        masks = self.get_passed_pawn_masks(colour_index, board)
+        masks = self.get_passed_pawn_masks(colour_index)
+        adjacent_file_masks = PrecomputedEvaluationData.adjacent_file_masks
         bonus = 0
         num_isolated_pawns = 0
 
-        for square in pawns:
+        for square in chess.scan_forward(friendly_pawns):
             # Check if this is a passed pawn (no enemy pawns that can block it)
-            if square in masks:
-                passed_mask = masks[square]
-                if not any(op_sq in passed_mask for op_sq in opponent_pawns):
-                    rank = chess.square_rank(square)
-                    num_squares_from_promotion = 7 - rank if colour_index == chess.WHITE else rank
-                    bonus += self.passed_pawn_bonuses[min(6, num_squares_from_promotion)]
+            if not masks[square] & opponent_pawns:
+                rank = square >> 3
+                num_squares_from_promotion = 7 - rank if colour_index == chess.WHITE else rank
+                bonus += self.passed_pawn_bonuses[min(6, num_squares_from_promotion)]
 
             # Check if this is an isolated pawn (no friendly pawns on adjacent files)
-            square_file = chess.square_file(square)
-            adjacent_files = self.get_adjacent_file_masks(square_file)
-            if not any(fp_sq in adjacent_files for fp_sq in friendly_pawns):
+            if not adjacent_file_masks[square & 7] & friendly_pawns:
                 num_isolated_pawns += 1
 
         return bonus + self.isolated_pawn_penalty_by_count[min(8, num_isolated_pawns)]
@@ -187,33 +183,34 @@ class Evaluation:
         colour_index = chess.WHITE if is_white else chess.BLACK
         value += self.evaluate_piece_square_table(
             PieceSquareTable.rooks,
-            list(board.pieces(chess.ROOK, colour_index)),
+            board.pieces_mask(chess.ROOK, colour_index),
             is_white
         )
         value += self.evaluate_piece_square_table(
             PieceSquareTable.knights,
-            list(board.pieces(chess.KNIGHT, colour_index)),
+            board.pieces_mask(chess.KNIGHT, colour_index),
             is_white
         )
         value += self.evaluate_piece_square_table(
             PieceSquareTable.bishops,
-            list(board.pieces(chess.BISHOP, colour_index)),
+            board.pieces_mask(chess.BISHOP, colour_index),
             is_white
         )
         value += self.evaluate_piece_square_table(
             PieceSquareTable.queens,
-            list(board.pieces(chess.QUEEN, colour_index)),
+            board.pieces_mask(chess.QUEEN, colour_index),
             is_white
         )
 
+        pawns = board.pieces_mask(chess.PAWN, colour_index)
         pawn_early = self.evaluate_piece_square_table(
             PieceSquareTable.pawns,
-            list(board.pieces(chess.PAWN, colour_index)),
+            pawns,
             is_white
         )
         pawn_late = self.evaluate_piece_square_table(
             PieceSquareTable.pawns_end,
-            list(board.pieces(chess.PAWN, colour_index)),
+            pawns,
             is_white
         )
         value += int(pawn_early * (1 - endgame_t))
@@ -234,23 +231,26 @@ class Evaluation:
 
         return value
 
-    def evaluate_piece_square_table(self, table, piece_list, is_white):
+    def evaluate_piece_square_table(self, table, pieces_mask, is_white):
+        # Tables are laid out from white's side, so white squares are mirrored vertically
+        flip = 56 if is_white else 0
         value = 0
-        for square in piece_list:
-            value += PieceSquareTable.read(table, square, is_white)
+        for square in chess.scan_forward(pieces_mask):
+            value += table[square ^ flip]
         return value
 
     def get_material_info(self, colour_index: int, board: chess.Board):
         # Implement a proper material info calculation
         opponent_index = chess.BLACK if colour_index == chess.WHITE else chess.WHITE
+        my_pawns = board.pieces_mask(chess.PAWN, colour_index)
         material_info = MaterialInfo(
-            num_pawns=len(board.pieces(chess.PAWN, colour_index)),
-            num_knights=len(board.pieces(chess.KNIGHT, colour_index)),
-            num_bishops=len(board.pieces(chess.BISHOP, colour_index)),
-            num_queens=len(board.pieces(chess.QUEEN, colour_index)),
-            num_rooks=len(board.pieces(chess.ROOK, colour_index)),
-            my_pawns=board.pieces(chess.PAWN, colour_index),
-            enemy_pawns=board.pieces(chess.PAWN, opponent_index)
+            num_pawns=chess.popcount(my_pawns),
+            num_knights=chess.popcount(board.pieces_mask(chess.KNIGHT, colour_index)),
+            num_bishops=chess.popcount(board.pieces_mask(chess.BISHOP, colour_index)),
+            num_queens=chess.popcount(board.pieces_mask(chess.QUEEN, colour_index)),
+            num_rooks=chess.popcount(board.pieces_mask(chess.ROOK, colour_index)),
+            my_pawns=my_pawns,
+            enemy_pawns=board.pieces_mask(chess.PAWN, opponent_index)
         )
 
         # Calculate endgame transition value
@@ -264,53 +264,15 @@ class Evaluation:
 
         return material_info
 
-    def get_passed_pawn_masks(self, colour_index: int, board: chess.Board):
-        """Generate masks of squares that must be empty for a pawn to be 'passed'"""
-        masks = {}
-        is_white = colour_index == chess.WHITE
-
-        # For each pawn, create a mask of squares in front of it
-        for square in board.pieces(chess.PAWN, colour_index):
-            file = chess.square_file(square)
-            rank = chess.square_rank(square)
-            target_mask = set()
-
-            # Direction of pawn movement depends on color
-            direction = 1 if is_white else -1
-
-            # Add squares directly in front of the pawn
-            current_rank = rank + direction
-            while 0 <= current_rank < 8:
-                target_mask.add(chess.square(file, current_rank))
-                current_rank += direction
-
-            # Also add diagonal squares that could contain enemy pawns
-            for adjacent_file in [file-1, file+1]:
-                if 0 <= adjacent_file < 8:
-                    current_rank = rank + direction
-                    while 0 <= current_rank < 8:
-                        target_mask.add(chess.square(adjacent_file, current_rank))
-                        current_rank += direction
-
-            masks[square] = target_mask
-
-        return masks
+    def get_passed_pawn_masks(self, colour_index: int):
+        """Per-square bitboards of the squares that must hold no enemy pawn for a pawn to be 'passed'"""
+        if colour_index == chess.WHITE:
+            return PrecomputedEvaluationData.passed_pawn_masks_white
+        return PrecomputedEvaluationData.passed_pawn_masks_black
 
     def get_adjacent_file_masks(self, file_index: int):
-        """Generate a set of squares on adjacent files"""
-        adjacent_files = set()
-
-        # Add squares on file to the left (if it exists)
-        if file_index > 0:
-            for rank in range(8):
-                adjacent_files.add(chess.square(file_index - 1, rank))
-
-        # Add squares on file to the right (if it exists)
-        if file_index < 7:
-            for rank in range(8):
-                adjacent_files.add(chess.square(file_index + 1, rank))
-
-        return adjacent_files
+        """Bitboard of the squares on the files adjacent to file_index"""
+        return PrecomputedEvaluationData.adjacent_file_masks[file_index]
 
 class MaterialInfo:
     def __init__(self, num_pawns, num_knights, num_bishops, num_queens, num_rooks, my_pawns, enemy_pawns):
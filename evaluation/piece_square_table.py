@@ -95,8 +95,9 @@ class PieceSquareTable:
 
     @staticmethod
     def read(table, square: int, is_white: bool):
+        # Mirror the rank for white; same as square(file, 7 - rank)
         if is_white:
-            square = chess.square(chess.square_file(square), 7 - chess.square_rank(square))
+            square ^= 56
         return table[square]
 
     @staticmethod
@@ -3,6 +3,11 @@ import chess
 class PrecomputedEvaluationData:
     pawn_shield_squares_white = []
     pawn_shield_squares_black = []
+    # Bitboards of the squares ahead of a pawn on its own and adjacent files
+    passed_pawn_masks_white = []
+    passed_pawn_masks_black = []
+    # Bitboards of the files next to each file
+    adjacent_file_masks = []
 
     @staticmethod
     def initialize():
@@ -12,6 +17,16 @@ class PrecomputedEvaluationData:
         for square_index in range(64):
             PrecomputedEvaluationData.create_pawn_shield_square(square_index)
 
+        PrecomputedEvaluationData.adjacent_file_masks = [
+            (chess.BB_FILES[file - 1] if file > 0 else 0) |
+            (chess.BB_FILES[file + 1] if file < 7 else 0)
+            for file in range(8)
+        ]
+        PrecomputedEvaluationData.passed_pawn_masks_white = [0] * 64
+        PrecomputedEvaluationData.passed_pawn_masks_black = [0] * 64
+        for square_index in range(64):
+            PrecomputedEvaluationData.create_passed_pawn_mask(square_index)
+
     @staticmethod
     def create_pawn_shield_square(square_index):
         shield_indices_white = []
@@ -32,6 +47,23 @@ class PrecomputedEvaluationData:
         PrecomputedEvaluationData.pawn_shield_squares_white[square_index] = shield_indices_white
         PrecomputedEvaluationData.pawn_shield_squares_black[square_index] = shield_indices_black
 
+    @staticmethod
+    def create_passed_pawn_mask(square_index):
+        file = square_index % 8
+        rank = square_index // 8
+        files_mask = chess.BB_FILES[file] | PrecomputedEvaluationData.adjacent_file_masks[file]
+
+        # Ranks strictly in front of the pawn, from each side's point of view
+        ahead_white = 0
+        for ahead_rank in range(rank + 1, 8):
+            ahead_white |= chess.BB_RANKS[ahead_rank]
+        ahead_black = 0
+        for ahead_rank in range(0, rank):
+            ahead_black |= chess.BB_RANKS[ahead_rank]
+
+        PrecomputedEvaluationData.passed_pawn_masks_white[square_index] = files_mask & ahead_white
+        PrecomputedEvaluationData.passed_pawn_masks_black[square_index] = files_mask & ahead_black
+
     @staticmethod
     def add_if_valid(file, rank, list_):
         if 0 <= file < 8 and 0 <= rank < 8:
@@ -1,5 +1,7 @@
 # Update the ui/app.py file to handle time mode selection
 
+import os
+
 from PyQt5.QtWidgets import QApplication, QDialog, QMessageBox
 from PyQt5.QtGui import QColor, QFont, QPalette
 from ui.board import ChessBoard
@@ -8,6 +10,10 @@ from ui.components.load_game_dialog import LoadGameDialog
 from ui.components.sidebar import SavedGameManager
 from ui.components.time_mode_dialog import TimeModeDialog
 
+# Static widget styles, parsed once for the whole application
+_STYLESHEET_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'style.qss')
+
 class ChessApp(QApplication):
     def __init__(self, args):
         super().__init__(args)
@@ -26,6 +32,9 @@ class ChessApp(QApplication):
         # Load a standard font that will be available on all systems
         self.setFont(QFont("Arial", 10))
         
+        with open(_STYLESHEET_PATH, encoding="utf-8") as f:
+            self.setStyleSheet(f.read())
+        
         self.chess_window = None
         self.show_start_screen()
     
@@ -2,27 +2,59 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QDialog,
     QSplitter, QFrame, QMessageBox
 )
-from PyQt5.QtCore import Qt, QPoint, QTimer, QPropertyAnimation
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QPoint, QTimer, QElapsedTimer, QPropertyAnimation
+from PyQt5.QtGui import QFont, QColor, QPalette
 from PyQt5.QtWidgets import QApplication
 
 from ui.components.popups import ResignConfirmationDialog, GameOverPopup
 
 import chess
 import sys
+from functools import partial
 import traceback
 import datetime
 import os
 
-from ui.components.board_components import ChessSquare, ThinkingIndicator
+from ui.components.board_components import BoardWidget, ChessSquare, ThinkingIndicator
 from ui.components.history import MoveHistoryWidget
 from ui.components.sidebar import AIControlPanel, SavedGameManager
 from ui.components.popups import PawnPromotionDialog, GameOverPopup, SaveGameDialog
 from ui.components.animations import AnimatedLabel
-# from ui.workers.ai_worker import AIWorker
 from ui.workers.ai_worker import ResponsiveAIManager
 from ui.components.chess_timer import ChessTimer
 from ui.components.time_mode_dialog import TimeModeDialog
+from utils.config import Config
+
+# Using filled/solid symbols for both colors; the piece color comes from
+# the pen, so only the piece type picks the glyph. The text variation
+# selector keeps platforms from substituting a colored emoji pawn.
+# Built once at import time so the board never rebuilds it while redrawing.
+# Indexed by piece type (PAWN = 1 ... KING = 6); index 0 is unused.
+_PIECE_SYMBOLS = ("", "♟︎", "♞︎", "♝︎", "♜︎", "♛︎", "♚︎")
+
+# Piece types for PawnPromotionDialog.get_choice() letters
+_PROMOTION_PIECES = {"q": chess.QUEEN, "r": chess.ROOK, "b": chess.BISHOP, "n": chess.KNIGHT}
+
+# Font of the moving piece overlay; its color is set through the palette
+_ANIMATED_PIECE_FONT = QFont("Arial", weight=QFont.Bold)
+_ANIMATED_PIECE_FONT.setPixelSize(40)
+
+# Piece colors indexed by chess.Color (BLACK is False, WHITE is True)
+_PIECE_COLORS = (QColor("#000000"), QColor("#FFFFFF"))
+_COLOR_NAMES = ("Black", "White")
+
+# (row, column) of the board widget for each square; row 0 is rank 8
+_UI_POS = tuple((7 - (square >> 3), square & 7) for square in range(64))
+
+def _is_capture(board, move, piece):
+    """Bitboard capture test for a legal move of piece by the side to move.
+    
+    Same answer as board.is_capture(move) without its generic en passant
+    check: only a pawn can land on the en passant square.
+    """
+    return bool(board.occupied_co[not board.turn] & chess.BB_SQUARES[move.to_square]) or (
+        piece.piece_type == chess.PAWN and move.to_square == board.ep_square
+    )
 
 def exception_hook(exctype, value, tb):
     print(f"Ngoại lệ không được xử lý: {exctype}")
@@ -64,40 +96,40 @@ class ChessBoard(QMainWindow):
         """)
         
         self.board = chess.Board()
+        self.game_over = False  # Cached board.is_game_over(), see update_game_over()
+        self.game_result = "*"  # Cached board.result(), kept alongside game_over
         self.selected_square = None
         
-        # Initialize chess bots ONCE here
-        from bot import ChessBot
-        if self.mode == "human_ai":
-            # One bot for human vs AI mode
-            self.ai_bot = ChessBot(opening_book_path="resources/komodo.bin")
-            self.turn = 'human'
-        else:
-            # Two bots for AI vs AI mode
-            self.ai_bot1 = ChessBot(opening_book_path="resources/komodo.bin")
-            self.ai_bot2 = ChessBot()  # Different bot without opening book for variety
-            self.turn = 'ai1'
+        # The GUI-side bots only mirror the game position (searches run in the
+        # worker process). Building one loads the opening book and runs a
+        # warm-up search, so they are created once the window is up.
+        self.ai_bot = None
+        self.ai_bot1 = None
+        self.ai_bot2 = None
+        QTimer.singleShot(0, self.create_bots)
             
         if self.mode == "human_ai":
             self.turn = 'human'
         else:
             self.turn = 'ai1'
             
-        self.valid_moves = []
-        self.castling_moves = []
+        self.select_square(None)
         self.last_move_from = None
         self.last_move_to = None
         
         self.ai_game_running = False
         self.move_delay = 800
+        # AI vs AI only; when off, moves are applied without the sliding piece
+        # and the next search starts right away
+        self.animate_moves = True
         self.ai_depth = 20
-        self.ai_worker = None
         self.ai_computation_active = False
 
         # Create the main layout with splitter for resizable panels
         self.central_widget = QWidget(self)
+        self.central_widget.setObjectName("centralWidget")
         self.setCentralWidget(self.central_widget)
-        self.central_widget.setStyleSheet("background-color: #2c3e50;")
+        self.central_widget.setStyleSheet("QWidget#centralWidget { background-color: #2c3e50; }")
 
         main_layout = QHBoxLayout(self.central_widget)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -106,6 +138,8 @@ class ChessBoard(QMainWindow):
         # Create a splitter for resizable sections
         self.main_splitter = QSplitter(Qt.Horizontal)
         self.main_splitter.setHandleWidth(2)
+        # Lay the board out once when the drag ends, not on every mouse move
+        self.main_splitter.setOpaqueResize(False)
         self.main_splitter.setStyleSheet("""
             QSplitter::handle {
                 background-color: #455a64;
@@ -124,9 +158,10 @@ class ChessBoard(QMainWindow):
         
         # Create board container with a nice border
         board_container = QFrame()
+        board_container.setObjectName("boardContainer")
         board_container.setFrameShape(QFrame.StyledPanel)
         board_container.setStyleSheet("""
-            QFrame {
+            QFrame#boardContainer {
                 background-color: #34495e;
                 border-radius: 10px;
                 padding: 15px;
@@ -136,27 +171,17 @@ class ChessBoard(QMainWindow):
         board_layout = QVBoxLayout(board_container)
         
         # Create board widget with fixed size
-        board_widget = QWidget()
-        board_widget.setStyleSheet("background-color: #455a64; padding: 5px; border-radius: 5px;")
+        board_widget = BoardWidget()
+        board_widget.setObjectName("boardWidget")
+        self.board_widget = board_widget
+        board_widget.setStyleSheet("QWidget#boardWidget { background-color: #455a64; padding: 5px; border-radius: 5px; }")
         
         from ui.board_layout_manager import SquareGridLayout
         self.board_layout = SquareGridLayout(board_widget)
         self.board_layout.setSpacing(0)
         self.board_layout.setContentsMargins(5, 5, 5, 5)
 
-        # Create squares and labels (existing code...)
-        for j in range(8):
-            col_label = QLabel(chr(97 + j))
-            col_label.setAlignment(Qt.AlignCenter)
-            col_label.setStyleSheet("color: white; font-weight: bold; font-size: 12pt;")
-            self.board_layout.addWidget(col_label, 8, j)
-            
-        for i in range(8):
-            row_label = QLabel(str(8 - i))
-            row_label.setAlignment(Qt.AlignCenter)
-            row_label.setStyleSheet("color: white; font-weight: bold; font-size: 12pt;")
-            self.board_layout.addWidget(row_label, i, 8)
-        
+        # Row 8 and column 8 hold the coordinates, which BoardWidget paints
         for i in range(9):
             self.board_layout.setColumnMinimumWidth(i, 60)
             if i < 9:
@@ -164,17 +189,6 @@ class ChessBoard(QMainWindow):
         
         # Create the squares
         self.squares = []
-        for j in range(8):
-            col_label = QLabel(chr(97 + j))
-            col_label.setAlignment(Qt.AlignCenter)
-            col_label.setStyleSheet("color: white; font-weight: bold; font-size: 12pt;")
-            self.board_layout.addWidget(col_label, 8, j)
-            
-            row_label = QLabel(str(8 - j))
-            row_label.setAlignment(Qt.AlignCenter)
-            row_label.setStyleSheet("color: white; font-weight: bold; font-size: 12pt;")
-            self.board_layout.addWidget(row_label, j, 8)
-        
         for i in range(8):
             row = []
             for j in range(8):
@@ -205,6 +219,7 @@ class ChessBoard(QMainWindow):
         sidebar_layout.setSpacing(15)
         
         sidebar_splitter = QSplitter(Qt.Vertical)
+        sidebar_splitter.setOpaqueResize(False)
         sidebar_layout.addWidget(sidebar_splitter)
         
         self.move_history = MoveHistoryWidget()
@@ -228,6 +243,7 @@ class ChessBoard(QMainWindow):
         self.control_panel.start_button.setEnabled(True)   # CHANGED: Enable start button initially
         self.control_panel.pause_button.setEnabled(False)
         self.control_panel.depth_slider.valueChanged.connect(self.update_ai_depth)
+        self.control_panel.animate_checkbox.toggled.connect(self.set_animate_moves)
         
         # Add to main splitter
         self.main_splitter.addWidget(game_area)
@@ -241,6 +257,7 @@ class ChessBoard(QMainWindow):
             
             self.control_panel.start_button.setText("▶ Start Game")
             self.control_panel.pause_button.setText("⏸ Pause Game")
+            self.control_panel.animate_checkbox.hide()
             
             # Update the title
             for i in range(self.control_panel.widget().layout().count()):
@@ -260,13 +277,29 @@ class ChessBoard(QMainWindow):
         else:
             self.thinking_indicator.show_status("Press 'Start AI Game' to begin")
         
-        # Set up timers
+        # Set up timers. The AI vs AI step is scheduled once per applied move,
+        # so a long search never has timeouts queuing up behind it; pausing
+        # or resetting stops the pending step. A precise timer keeps the
+        # spacing at the chosen move delay instead of the coarse default.
         self.ai_timer = QTimer(self)
+        self.ai_timer.setSingleShot(True)
+        self.ai_timer.setTimerType(Qt.PreciseTimer)
         self.ai_timer.timeout.connect(self.ai_vs_ai_step)
-        
-        self.animated_pieces = {}
+        # Started when an AI vs AI move begins, so its animation counts
+        # toward the move delay instead of adding to it
+        self.move_clock = QElapsedTimer()
+        
+        # Idle animation overlays, reused from one move to the next
+        self.animation_pool = []
+        # Overlays currently moving, whose callbacks are still to run
+        self.active_animations = []
+        # Origin squares of the moving pieces, drawn empty until the move lands
+        self.moving_squares = set()
         self.piece_symbols = self.initialize_piece_symbols()
         
+        # Last drawn state of each square, used to skip unchanged squares
+        self._last_render = [[None] * 8 for _ in range(8)]
+        
         sys.excepthook = exception_hook
 
         # CRITICAL FIX: Only show time dialog for NEW games from app.py
@@ -298,7 +331,6 @@ class ChessBoard(QMainWindow):
         self.black_time_ms = black_time_ms
         
         # Store increment values for smart time management
-        from utils.config import Config
         self.white_increment_ms = white_inc_ms if white_inc_ms is not None else Config.DEFAULT_WHITE_INCREMENT_MS
         self.black_increment_ms = black_inc_ms if black_inc_ms is not None else Config.DEFAULT_BLACK_INCREMENT_MS
         
@@ -325,12 +357,10 @@ class ChessBoard(QMainWindow):
             winner_text = "White wins on time!"
             result = '1-0'
         
-        # Stop any ongoing AI processes
-        if hasattr(self, 'ai_computation_active') and self.ai_computation_active:
-            if hasattr(self, 'ai_worker') and self.ai_worker and self.ai_worker.isRunning():
-                self.ai_worker.terminate()
-                self.ai_worker = None
-                self.ai_computation_active = False
+        # Stop any ongoing AI search; the engine checks the cancel flag as it runs
+        if self.ai_computation_active:
+            self.ai_manager.cancel_computation()
+            self.ai_computation_active = False
         
         # Stop AI game if running
         if hasattr(self, 'ai_game_running') and self.ai_game_running:
@@ -340,6 +370,8 @@ class ChessBoard(QMainWindow):
         
         # Force the board into a game over state
         self.board.set_result(result)
+        self.game_over = True
+        self.game_result = result
         
         # Update the UI
         self.thinking_indicator.stop_thinking()
@@ -357,7 +389,7 @@ class ChessBoard(QMainWindow):
     
     def start_human_ai_game(self):
         """Start Human vs AI game with timer support."""
-        if not self.board.is_game_over():
+        if not self.game_over:
             # Update button states
             self.control_panel.start_button.setEnabled(False)
             self.control_panel.pause_button.setEnabled(True)
@@ -375,7 +407,7 @@ class ChessBoard(QMainWindow):
             else:
                 # If it's AI's turn, start AI immediately
                 self.thinking_indicator.start_thinking("AI")
-                QTimer.singleShot(100, self.ai_move)
+                QTimer.singleShot(0, self.ai_move)
 
     def pause_human_ai_game(self):
         """Pause Human vs AI game."""
@@ -504,6 +536,7 @@ class ChessBoard(QMainWindow):
         try:
             # Setup the board with the saved FEN position
             self.board = chess.Board(game_data['fen'])
+            self.update_game_over()
             
             # Set the mode and turn
             self.mode = game_data['mode']
@@ -511,8 +544,9 @@ class ChessBoard(QMainWindow):
             
             # Update bot positions to match loaded game
             if self.mode == "human_ai":
-                self.ai_bot.set_position(fen=game_data['fen'])
-            else:
+                if self.ai_bot:
+                    self.ai_bot.set_position(fen=game_data['fen'])
+            elif self.ai_bot1:
                 self.ai_bot1.set_position(fen=game_data['fen'])
                 self.ai_bot2.set_position(fen=game_data['fen'])
             
@@ -551,37 +585,19 @@ class ChessBoard(QMainWindow):
                         self.chess_timer.active_player = active_player
                         self.chess_timer.update_active_player_display()
             
-            # Rebuild move history
-            self.move_history.clear_history()
-            temp_board = chess.Board()
-            for i, move_uci in enumerate(game_data['move_history']):
-                move = chess.Move.from_uci(move_uci)
-                from_square = chess.square_name(move.from_square)
-                to_square = chess.square_name(move.to_square)
-                piece = temp_board.piece_at(move.from_square)
-                
-                is_capture = temp_board.is_capture(move)
-                is_check = False  # We'll determine this after making the move
-                
-                # Make the move on our temporary board
-                temp_board.push(move)
-                is_check = temp_board.is_check()
-                
-                # Determine if it's castling
-                is_castling = (piece and piece.piece_type == chess.KING and 
-                            abs(move.from_square % 8 - move.to_square % 8) > 1)
-                
-                # Add to move history
-                self.move_history.add_move(
-                    piece,
-                    from_square,
-                    to_square,
-                    "White" if i % 2 == 0 else "Black",
-                    is_capture,
-                    is_check,
-                    move.promotion,
-                    is_castling
-                )
+            # Rebuild move history, painting the list once at the end
+            self.move_history.setUpdatesEnabled(False)
+            try:
+                self.move_history.clear_history()
+                temp_board = chess.Board()
+                for i, move_uci in enumerate(game_data['move_history']):
+                    move = chess.Move.from_uci(move_uci)
+                    
+                    # Add to move history, then replay it on our temporary board
+                    self.move_history.add_move(temp_board, move, "White" if i % 2 == 0 else "Black")
+                    temp_board.push(move)
+            finally:
+                self.move_history.setUpdatesEnabled(True)
             
             # Update the board display
             self.update_board()
@@ -598,24 +614,21 @@ class ChessBoard(QMainWindow):
             QMessageBox.critical(self, "Error", f"Could not load game: {str(e)}")
             return False
     
+    def create_bots(self):
+        """Create the GUI-side bots for the current mode and position."""
+        from bot import ChessBot
+        fen = self.board.fen()
+        if self.mode == "human_ai":
+            # One bot for human vs AI mode
+            self.ai_bot = ChessBot(fen, opening_book_path="resources/komodo.bin")
+        else:
+            # Two bots for AI vs AI mode
+            self.ai_bot1 = ChessBot(fen, opening_book_path="resources/komodo.bin")
+            self.ai_bot2 = ChessBot(fen)  # Different bot without opening book for variety
+    
     def initialize_piece_symbols(self):
-        """Create enhanced chess piece symbols with better visibility and style"""
-        # Using filled/solid symbols for white pieces instead of outline versions
-        piece_symbols = {
-            (chess.PAWN, chess.WHITE): "♟︎",    # Solid white pawn
-            (chess.PAWN, chess.BLACK): "♟",     # Black pawn
-            (chess.KNIGHT, chess.WHITE): "♞︎",   # Solid white knight
-            (chess.KNIGHT, chess.BLACK): "♞",    # Black knight
-            (chess.BISHOP, chess.WHITE): "♝︎",   # Solid white bishop
-            (chess.BISHOP, chess.BLACK): "♝",    # Black bishop
-            (chess.ROOK, chess.WHITE): "♜︎",     # Solid white rook
-            (chess.ROOK, chess.BLACK): "♜",      # Black rook
-            (chess.QUEEN, chess.WHITE): "♛︎",    # Solid white queen
-            (chess.QUEEN, chess.BLACK): "♛",     # Black queen
-            (chess.KING, chess.WHITE): "♚︎",     # Solid white king
-            (chess.KING, chess.BLACK): "♚",      # Black king
-        }
-        return piece_symbols
+        """Return the shared table of chess piece symbols, indexed by piece type"""
+        return _PIECE_SYMBOLS
     
     def return_to_home(self):
         """Return to the start screen - MULTIPROCESS VERSION."""
@@ -659,7 +672,7 @@ class ChessBoard(QMainWindow):
             }
             
             # Ask if user wants to save game only if it has changed since last save
-            if not self.board.is_game_over() and len(self.board.move_stack) > 0 and current_state != last_saved_state:
+            if not self.game_over and len(self.board.move_stack) > 0 and current_state != last_saved_state:
                 try:
                     reply = QMessageBox.question(
                         self, 
@@ -732,6 +745,10 @@ class ChessBoard(QMainWindow):
         self.move_delay = 800  # Default value
         # No longer needed since we're using depth-based timing
     
+    def set_animate_moves(self, enabled):
+        """Turn the AI vs AI move animation on or off"""
+        self.animate_moves = enabled
+    
     def update_ai_depth(self, value):
         """Update the AI thinking depth"""
         self.ai_depth = value
@@ -739,7 +756,7 @@ class ChessBoard(QMainWindow):
     
     def start_ai_game(self):
         """Start AI vs AI game with timer support."""
-        if not self.ai_game_running and not self.board.is_game_over() and not self.ai_computation_active:
+        if not self.ai_game_running and not self.game_over and not self.ai_computation_active:
             self.ai_game_running = True
             self.control_panel.start_button.setEnabled(False)
             self.control_panel.pause_button.setEnabled(True)
@@ -757,7 +774,7 @@ class ChessBoard(QMainWindow):
             else:
                 self.thinking_indicator.start_thinking("AI 2")
             
-            # Start the AI move timer
+            # Schedule the first AI move
             self.ai_timer.start(self.move_delay)
     
     def pause_ai_game(self):
@@ -787,6 +804,7 @@ class ChessBoard(QMainWindow):
         """Reset the game to initial state - with proper time dialog handling."""
         # Stop and cleanup AI processes first
         self.stop_thinking()
+        self.cancel_animations()
         
         self.ai_game_running = False
         self.ai_timer.stop()
@@ -796,33 +814,32 @@ class ChessBoard(QMainWindow):
         if self.is_time_mode:
             self.chess_timer.stop_timer()
         
-        # Cancel any ongoing AI computation
-        if self.ai_worker and self.ai_worker.isRunning():
-            self.ai_worker.terminate()
-            self.ai_worker = None
-            self.ai_computation_active = False
-            
         self.board = chess.Board()
+        self.game_over = False
+        self.game_result = "*"
         
         # Reset bot positions
         if self.mode == "human_ai":
-            self.ai_bot.set_position()  # Reset to starting position
-            self.ai_bot.notify_new_game()  # Clear transposition tables
+            if self.ai_bot:
+                self.ai_bot.set_position()  # Reset to starting position
+                self.ai_bot.notify_new_game()  # Clear transposition tables
             self.turn = 'human'
         else:
-            self.ai_bot1.set_position()  # Reset to starting position
-            self.ai_bot1.notify_new_game()
-            self.ai_bot2.set_position()  # Reset to starting position
-            self.ai_bot2.notify_new_game()
+            if self.ai_bot1:
+                self.ai_bot1.set_position()  # Reset to starting position
+                self.ai_bot1.notify_new_game()
+                self.ai_bot2.set_position()  # Reset to starting position
+                self.ai_bot2.notify_new_game()
             self.turn = 'ai1'
         
+        # Forget the previous game's cached AI moves
+        self.ai_manager.clear_cache()
+        
         self.control_panel.start_button.setEnabled(True)
         self.control_panel.pause_button.setEnabled(False)
         
         # Clear selection and move indicators
-        self.selected_square = None
-        self.valid_moves = []
-        self.castling_moves = []
+        self.select_square(None)
             
         self.last_move_from = None
         self.last_move_to = None
@@ -879,50 +896,76 @@ class ChessBoard(QMainWindow):
     
     def animate_piece_movement(self, from_pos, to_pos, piece_symbol, piece_color, capture=False, callback=None):
         """Animate a piece moving from one square to another"""
-        # Create the animated piece (temporary overlay)
-        animated_piece = AnimatedLabel(self.central_widget)
+        # Reuse an idle overlay, creating one only when all are busy
+        if self.animation_pool:
+            animated_piece = self.animation_pool.pop()
+        else:
+            animated_piece = AnimatedLabel(self.central_widget)
+            animated_piece.setAlignment(Qt.AlignCenter)
+            animated_piece.setFixedSize(60, 60)
+            animated_piece.setFont(_ANIMATED_PIECE_FONT)
+            animated_piece.piece_color = None
+            animated_piece.animation_finished.connect(partial(self.finish_animation, animated_piece))
+        
         animated_piece.setText(piece_symbol)
-        animated_piece.setAlignment(Qt.AlignCenter)
-        animated_piece.setStyleSheet(f"""
-            font-size: 40px; 
-            background-color: transparent; 
-            color: {piece_color};
-            font-weight: bold;
-        """)
-        animated_piece.setFixedSize(60, 60)
+        if animated_piece.piece_color is not piece_color:
+            palette = animated_piece.palette()
+            palette.setColor(QPalette.WindowText, piece_color)
+            animated_piece.setPalette(palette)
+            animated_piece.piece_color = piece_color
+        animated_piece.callback = callback
+        self.active_animations.append(animated_piece)
+        
+        # Lift the piece off its square while the overlay carries it
+        from_square_widget = self.squares[from_pos[0]][from_pos[1]]
+        animated_piece.square = from_square_widget.square
+        self.moving_squares.add(animated_piece.square)
+        self.refresh_squares((animated_piece.square,))
         
         # Position at the starting square
-        from_rect = self.squares[from_pos[0]][from_pos[1]].geometry()
-        global_from_pos = self.squares[from_pos[0]][from_pos[1]].mapTo(self.central_widget, QPoint(0, 0))
+        global_from_pos = from_square_widget.mapTo(self.central_widget, QPoint(0, 0))
         
         animated_piece.move(global_from_pos)
+        animated_piece.raise_()
         animated_piece.show()
         
         # Calculate the end position
         global_to_pos = self.squares[to_pos[0]][to_pos[1]].mapTo(self.central_widget, QPoint(0, 0))
         
-        # Set up animation
-        animated_piece.animation.finished.connect(lambda: self.finish_animation(animated_piece, callback))
-        
         # Start the animation
         animated_piece.move_to(global_to_pos)
-        
-        # Store the animated piece to prevent garbage collection
-        self.animated_pieces[id(animated_piece)] = animated_piece
     
-    def finish_animation(self, animated_piece, callback=None):
-        """Clean up after animation is complete and call the callback"""
-        # Remove the animated piece from display and memory
+    def finish_animation(self, animated_piece):
+        """Hide the overlay, return it to the pool and call the move's callback"""
         animated_piece.hide()
-        self.animated_pieces.pop(id(animated_piece), None)
+        callback = animated_piece.callback
+        animated_piece.callback = None
+        self.active_animations.remove(animated_piece)
+        self.animation_pool.append(animated_piece)
+        self.moving_squares.discard(animated_piece.square)
+        self.refresh_squares((animated_piece.square,))
         
         # Call the callback if provided
         if callback:
             callback()
     
+    def cancel_animations(self):
+        """Stop every moving piece without applying the moves they carry"""
+        for animated_piece in self.active_animations:
+            animated_piece.cancel_animation()
+            animated_piece.hide()
+            animated_piece.callback = None
+            self.animation_pool.append(animated_piece)
+        self.active_animations.clear()
+        
+        # Put the pieces back on the squares they were leaving
+        moving_squares = self.moving_squares
+        self.moving_squares = set()
+        self.refresh_squares(moving_squares)
+    
     def ai_vs_ai_step(self):
         """Execute a single step in the AI vs AI game with smart time management."""
-        if self.ai_game_running and not self.board.is_game_over() and not self.ai_computation_active:
+        if self.ai_game_running and not self.game_over and not self.ai_computation_active:
             # Set flag to prevent overlapping computations
             self.ai_computation_active = True
             
@@ -932,15 +975,10 @@ class ChessBoard(QMainWindow):
             # Update thinking indicator
             self.thinking_indicator.start_thinking(current_ai)
             
-            # Stop the AI timer during calculation
-            self.ai_timer.stop()
-            
             # Get current board state
             board_fen = self.board.fen()
             
             # Prepare time management parameters
-            from utils.config import Config
-            
             if self.is_time_mode:
                 # Get current time remaining for both players
                 white_time_ms, black_time_ms = self.chess_timer.get_remaining_times()
@@ -1014,13 +1052,9 @@ class ChessBoard(QMainWindow):
                 # Convert the move to chess.Move object
                 move = chess.Move.from_uci(best_move_uci)
                 
-                # Get information for the move
-                from_square = chess.square_rank(move.from_square), chess.square_file(move.from_square)
-                to_square = chess.square_rank(move.to_square), chess.square_file(move.to_square)
-                
-                # Convert to UI coordinates
-                from_pos = (7 - from_square[0], from_square[1])
-                to_pos = (7 - to_square[0], to_square[1])
+                # Convert the squares to UI coordinates
+                from_pos = _UI_POS[move.from_square]
+                to_pos = _UI_POS[move.to_square]
                 
                 # Get the piece information
                 piece = self.board.piece_at(move.from_square)
@@ -1035,16 +1069,13 @@ class ChessBoard(QMainWindow):
                     self.thinking_indicator.show_status("Invalid move: No piece found")
                     return
                     
-                piece_color = "#FFFFFF" if piece.color == chess.WHITE else "#000000"
+                piece_color = _PIECE_COLORS[piece.color]
                 
                 # Determine piece symbol for animation
-                piece_symbol = self.piece_symbols.get((piece.piece_type, piece.color), "")
+                piece_symbol = self.piece_symbols[piece.piece_type]
                 
                 # Check if move is a capture
-                is_capture = self.board.is_capture(move)
-                
-                # Check if move is castling
-                is_castling = piece and piece.piece_type == chess.KING and abs(move.from_square % 8 - move.to_square % 8) > 1
+                is_capture = _is_capture(self.board, move, piece)
                 
                 # Stop thinking indicator during animation
                 self.thinking_indicator.stop_thinking()
@@ -1055,70 +1086,13 @@ class ChessBoard(QMainWindow):
                     next_player = 'black' if next_turn == 'ai2' else 'white'
                     self.chess_timer.switch_player(next_player)
                 
-                # Function to execute after animation completes
-                def after_animation():
-                    try:
-                        # Make the move on the actual board
-                        self.board.push(move)
-                        
-                        # Update the appropriate bot's position
-                        if self.turn == 'ai1':
-                            self.ai_bot1.make_move(move.uci())
-                        else:
-                            self.ai_bot2.make_move(move.uci())
-                        
-                        self.apply_time_increment(self.turn)
-                        
-                        # Add move to history
-                        from_uci = chess.square_name(move.from_square)
-                        to_uci = chess.square_name(move.to_square)
-                        is_check = self.board.is_check()
-                        
-                        self.move_history.add_move(
-                            piece, 
-                            from_uci, 
-                            to_uci, 
-                            "White" if piece.color == chess.WHITE else "Black",
-                            is_capture,
-                            is_check,
-                            move.promotion,
-                            is_castling
-                        )
-                        
-                        # Update the board display
-                        self.last_move_from = from_pos
-                        self.last_move_to = to_pos
-                        self.update_board()
-                        
-                        # Check if game is over
-                        if self.board.is_game_over():
-                            self.ai_game_running = False
-                            if self.is_time_mode:
-                                self.chess_timer.stop_timer()
-                            self.control_panel.start_button.setEnabled(False)
-                            self.control_panel.pause_button.setEnabled(False)
-                            self.show_game_over_popup()
-                        else:
-                            # Switch to next AI
-                            self.turn = next_turn
-                            
-                            # Update status text
-                            next_ai = "AI 1" if self.turn == 'ai1' else "AI 2"
-                            self.thinking_indicator.start_thinking(next_ai)
-                            self.thinking_indicator.show_status("")
-                            
-                            # Resume the AI timer for next move
-                            self.ai_timer.start(self.move_delay)
-                    except Exception as e:
-                        print(f"Error in after_animation: {str(e)}")
-                        self.ai_game_running = False
-                        if self.is_time_mode:
-                            self.chess_timer.stop_timer()
-                        self.thinking_indicator.stop_thinking()
-                        self.thinking_indicator.show_status(f"Error: {str(e)}")
-                
-                # Animate the piece movement
-                self.animate_piece_movement(from_pos, to_pos, piece_symbol, piece_color, is_capture, after_animation)
+                finish = partial(self.finish_ai_vs_ai_move, move, from_pos, to_pos, _COLOR_NAMES[piece.color], next_turn)
+                self.move_clock.start()
+                if self.animate_moves:
+                    # Animate the piece movement
+                    self.animate_piece_movement(from_pos, to_pos, piece_symbol, piece_color, is_capture, finish)
+                else:
+                    finish()
             except Exception as e:
                 print(f"Error handling AI move: {str(e)}")
                 self.ai_game_running = False
@@ -1138,30 +1112,142 @@ class ChessBoard(QMainWindow):
             self.control_panel.pause_button.setEnabled(False)
             self.thinking_indicator.show_status("No valid moves available")
     
+    def finish_ai_vs_ai_move(self, move, from_pos, to_pos, mover_name, next_turn):
+        """Apply an AI vs AI move once its animation has finished"""
+        try:
+            # Add move to history while the board still shows the position before it
+            self.move_history.add_move(
+                self.board, move, mover_name
+            )
+
+            # Make the move on the actual board
+            changed_squares = self.move_squares(move)
+            self.board.push(move)
+            self.update_game_over()
+
+            # Update the appropriate bot's position
+            bot = self.ai_bot1 if self.turn == 'ai1' else self.ai_bot2
+            if bot:
+                bot.make_move(move.uci())
+
+            self.apply_time_increment(self.turn)
+
+            # Update the board display
+            self.last_move_from = from_pos
+            self.last_move_to = to_pos
+            self.update_board(changed_squares)
+
+            # Check if game is over
+            if self.game_over:
+                self.ai_game_running = False
+                if self.is_time_mode:
+                    self.chess_timer.stop_timer()
+                self.control_panel.start_button.setEnabled(False)
+                self.control_panel.pause_button.setEnabled(False)
+                self.show_game_over_popup()
+            else:
+                # Switch to next AI
+                self.turn = next_turn
+
+                # Update status text
+                next_ai = "AI 1" if self.turn == 'ai1' else "AI 2"
+                self.thinking_indicator.start_thinking(next_ai)
+                self.thinking_indicator.show_status("")
+
+                # Schedule the next AI move once the move delay has passed
+                # since this one started, or as soon as this event finishes
+                # when animations are off
+                if self.animate_moves:
+                    self.ai_timer.start(max(0, self.move_delay - self.move_clock.elapsed()))
+                else:
+                    self.ai_timer.start(0)
+        except Exception as e:
+            print(f"Error finishing AI vs AI move: {str(e)}")
+            self.ai_game_running = False
+            if self.is_time_mode:
+                self.chess_timer.stop_timer()
+            self.thinking_indicator.stop_thinking()
+            self.thinking_indicator.show_status(f"Error: {str(e)}")
+
+    def update_game_over(self):
+        """Recompute the cached game over flag and result after self.board changes.
+        
+        Finding the outcome has to generate legal moves to spot checkmate and
+        stalemate, so it runs once per position instead of on every click
+        and redraw, and the result string comes from that same call.
+        """
+        outcome = self.board.outcome()
+        self.game_over = outcome is not None
+        self.game_result = outcome.result() if outcome else "*"
+        return self.game_over
+
+    def select_square(self, square):
+        """Select the piece on the given square index, or clear the selection with None.
+        
+        The destination squares are collected here, once per selection, as
+        sets for constant-time lookups in update_board().
+        """
+        self.selected_square = square
+        if square is None:
+            self.valid_moves = []
+            self.castling_moves = []
+        else:
+            self.valid_moves, self.castling_moves = self.find_valid_moves(square)
+        self.valid_destinations = frozenset(move.to_square for move in self.valid_moves)
+        self.castling_destinations = frozenset(move.to_square for move in self.castling_moves)
+
     def find_valid_moves(self, from_square):
-        """Find all valid moves for a piece on the given square"""
+        """Find all valid moves for a piece on the given square index"""
         valid_moves = []
         castling_moves = []
-        from_square_index = chess.parse_square(from_square)
         
-        piece = self.board.piece_at(from_square_index)
+        piece = self.board.piece_at(from_square)
         
-        for move in self.board.legal_moves:
-            if move.from_square == from_square_index:
-                # Identify castling moves for special highlighting
-                if piece and piece.piece_type == chess.KING and abs(move.from_square % 8 - move.to_square % 8) > 1:
-                    castling_moves.append(move)
-                else:
-                    valid_moves.append(move)
+        # Only generate moves that start on the selected square
+        for move in self.board.generate_legal_moves(from_mask=chess.BB_SQUARES[from_square]):
+            # Identify castling moves for special highlighting
+            if piece and piece.piece_type == chess.KING and abs(move.from_square % 8 - move.to_square % 8) > 1:
+                castling_moves.append(move)
+            else:
+                valid_moves.append(move)
                 
         return valid_moves, castling_moves
 
-    def update_board(self):
-        """Update the visual representation of the chess board"""
+    def move_squares(self, move):
+        """Return the square indices whose look can change when move is played.
+        
+        Call it before pushing the move. Besides both ends of the move, this
+        covers the last move and selection highlights, both kings for the
+        check highlight, and the rook or pawn that castling or en passant
+        also moves, so the board can skip the other squares.
+        """
+        board = self.board
+        squares = {move.from_square, move.to_square}
+        squares |= self.valid_destinations | self.castling_destinations
+        for square in (self.selected_square, board.king(chess.WHITE), board.king(chess.BLACK)):
+            if square is not None:
+                squares.add(square)
+        for pos in (self.last_move_from, self.last_move_to):
+            if pos is not None:
+                squares.add(self.squares[pos[0]][pos[1]].square)
+        
+        if board.is_castling(move):
+            # The rook stays on the back rank
+            rank_start = move.from_square & ~7
+            squares.update(range(rank_start, rank_start + 8))
+        elif board.is_en_passant(move):
+            # The captured pawn sits beside the origin square
+            squares.add((move.from_square & ~7) | (move.to_square & 7))
+        return squares
+
+    def refresh_squares(self, squares):
+        """Redraw the given squares (python-chess indices) that changed since they were last drawn"""
 
-        selected = chess.parse_square(self.selected_square) if self.selected_square else None
-        valid_destinations = [move.to_square for move in self.valid_moves]
-        castling_destinations = [move.to_square for move in self.castling_moves]
+        selected = self.selected_square
+        valid_destinations = self.valid_destinations
+        castling_destinations = self.castling_destinations
+        # Pieces that are sliding to another square are drawn by their overlay
+        moving_squares = self.moving_squares
         
         # Check if kings are in check
         white_king_in_check = False
@@ -1172,80 +1258,83 @@ class ChessBoard(QMainWindow):
             black_king_in_check = self.board.turn == chess.BLACK
         
         # Find king squares
-        white_king_square = None
-        black_king_square = None
-        
-        for sq in chess.SQUARES:
-            piece = self.board.piece_at(sq)
-            if piece and piece.piece_type == chess.KING:
-                if piece.color == chess.WHITE:
-                    white_king_square = sq
-                else:
-                    black_king_square = sq
+        white_king_square = self.board.king(chess.WHITE)
+        black_king_square = self.board.king(chess.BLACK)
 
-        for i in range(8):
-            for j in range(8):
-                square = chess.square(j, 7 - i)
-                piece = self.board.piece_at(square)
-                square_widget = self.squares[i][j]
-
-                # Reset states
-                square_widget.is_selected = False
-                square_widget.is_last_move = False
-                square_widget.is_valid_move = False
-                square_widget.is_castling_move = False
-                square_widget.is_checked = False
-                
-                # Set states based on game state
-                if selected == square:
-                    square_widget.is_selected = True
-                if (i, j) == self.last_move_from or (i, j) == self.last_move_to:
-                    square_widget.is_last_move = True
-                if square in valid_destinations:
-                    square_widget.is_valid_move = True
-                if square in castling_destinations:
-                    square_widget.is_castling_move = True
-                    
-                # Highlight king in check
-                if (white_king_in_check and square == white_king_square) or \
-                (black_king_in_check and square == black_king_square):
-                    square_widget.is_checked = True
-                    
-                # Update the square appearance before setting text
-                square_widget.update_appearance()
+        # One pass over the occupied squares instead of 64 piece_at() calls
+        piece_map = self.board.piece_map()
+        piece_symbols = self.piece_symbols
+
+        # Squares whose look changed since they were last drawn
+        changed = []
+
+        square_widgets = self.squares
+        last_move_from = self.last_move_from
+        last_move_to = self.last_move_to
+        for square in squares:
+            # _UI_POS gives the square's (row, column) on the board widget
+            pos = _UI_POS[square]
+            piece = piece_map.get(square)
+
+            # Work out the square's state from the game state
+            is_selected = selected == square
+            is_last_move = pos == last_move_from or pos == last_move_to
+            is_valid_move = square in valid_destinations
+            is_castling_move = square in castling_destinations
+            
+            # Highlight king in check
+            is_checked = (white_king_in_check and square == white_king_square) or \
+                (black_king_in_check and square == black_king_square)
+            
+            # Work out the piece symbol and color
+            if piece and square not in moving_squares:
+                symbol = piece_symbols[piece.piece_type]
+                piece_color = piece.color
+            else:
+                symbol = ""
+                piece_color = None
+            
+            # Skip squares that look the same as the last time they were drawn
+            render = (symbol, piece_color, is_selected, is_last_move,
+                      is_valid_move, is_castling_move, is_checked)
+            i, j = pos
+            if render != self._last_render[i][j]:
+                self._last_render[i][j] = render
+                changed.append((square_widgets[i][j], render))
+
+        # A reset or a loaded game redraws most of the board, so hold the
+        # repaints and let the board widget repaint once when re-enabled.
+        # Normal moves only touch a few squares and repaint just those.
+        batch = len(changed) > 16
+        if batch:
+            self.board_widget.setUpdatesEnabled(False)
+        try:
+            for square_widget, render in changed:
+                (symbol, piece_color, square_widget.is_selected, square_widget.is_last_move,
+                 square_widget.is_valid_move, square_widget.is_castling_move,
+                 square_widget.is_checked) = render
                 
                 # Draw piece or empty square
-                if piece:
-                    symbol = self.piece_symbols.get((piece.piece_type, piece.color), "")
-                    piece_color = "#000000" if piece.color == chess.BLACK else "#FFFFFF"
-                    
-                    # Ensure king is visible even when checked
-                    square_widget.setText(symbol)
-                    
-                    # Use a special style for the king when in check
-                    if square_widget.is_checked and piece.piece_type == chess.KING:
-                        # Make king clearly visible against the check highlight
-                        square_widget.setStyleSheet(square_widget.styleSheet() + f"""
-                            font-size: 40px; 
-                            color: {piece_color};
-                            font-weight: bold;
-                            margin: 2px;
-                            background-color: transparent;
-                        """)
-                    else:
-                        square_widget.setStyleSheet(square_widget.styleSheet() + f"""
-                            font-size: 40px; 
-                            color: {piece_color};
-                            font-weight: bold;
-                        """)
-                else:
-                    square_widget.setText("")
-                    
+                square_widget.set_piece(
+                    symbol, _PIECE_COLORS[piece_color] if piece_color is not None else None
+                )
+                square_widget.update_appearance()
+        finally:
+            if batch:
+                self.board_widget.setUpdatesEnabled(True)
 
+    def update_board(self, squares=None):
+        """Update the visual representation of the chess board
+        
+        Args:
+            squares: Square indices that can have changed, such as the ones
+                from move_squares(); by default every square is checked
+        """
+        self.refresh_squares(range(64) if squares is None else squares)
 
         # Check for game over
-        if self.board.is_game_over():
-            result = self.board.result()
+        if self.game_over:
+            result = self.game_result
             if result == '1-0':
                 winner = "Player (White)" if self.mode == "human_ai" else "AI 1 (White)"
                 self.thinking_indicator.show_status(f"{winner} Wins!")
@@ -1260,10 +1349,6 @@ class ChessBoard(QMainWindow):
                 self.ai_game_running = False
                 self.ai_timer.stop()
                 self.thinking_indicator.stop_thinking()
-                if self.ai_worker and self.ai_worker.isRunning():
-                    self.ai_worker.terminate()
-                    self.ai_worker = None
-                    self.ai_computation_active = False
                     
                 self.control_panel.start_button.setEnabled(False)
                 self.control_panel.pause_button.setEnabled(False)
@@ -1287,28 +1372,28 @@ class ChessBoard(QMainWindow):
                     else:
                         self.thinking_indicator.show_status("Press 'Start' to continue AI vs AI game")
 
-    def player_move(self, i, j):
-        """Handle player move selection with timer support."""
-        if self.mode != "human_ai" or self.turn != 'human' or self.board.is_game_over() or self.ai_computation_active:
+    def player_move(self, square):
+        """Handle player move selection with timer support.
+        
+        Args:
+            square: python-chess index of the clicked square
+        """
+        if self.mode != "human_ai" or self.turn != 'human' or self.game_over or self.ai_computation_active:
             return
-            
-        square = chess.square(j, 7 - i)
-        current_square = chess.SQUARE_NAMES[square]
+
+        # Set when the selection changes; the board is redrawn once at the end
+        dirty = False
 
         if self.selected_square is None:
             piece = self.board.piece_at(square)
             if piece and piece.color == self.board.turn:
-                self.selected_square = current_square
-                self.valid_moves, self.castling_moves = self.find_valid_moves(current_square)
-                self.update_board()
+                self.select_square(square)
+                dirty = True
+        elif self.selected_square == square:
+            # Clicking the selected piece again deselects it
+            self.select_square(None)
+            dirty = True
         else:
-            if self.selected_square == current_square:
-                self.selected_square = None
-                self.valid_moves = []
-                self.castling_moves = []
-                self.update_board()
-                return
-                
             move_made = False
             
             # Check both regular and castling moves
@@ -1316,103 +1401,53 @@ class ChessBoard(QMainWindow):
             
             for move in all_valid_moves:
                 if move.to_square == square:
-                    from_square = chess.parse_square(self.selected_square)
+                    from_square = self.selected_square
                     piece = self.board.piece_at(from_square)
                     
                     # Handle pawn promotion
                     is_promotion = (piece and piece.piece_type == chess.PAWN and
-                                (chess.square_rank(square) == 0 or chess.square_rank(square) == 7))
+                                square // 8 in (0, 7))
 
                     if is_promotion:
                         try:
                             dialog = PawnPromotionDialog(self)
                             if dialog.exec_() == QDialog.Accepted:
                                 promotion_piece = dialog.get_choice()
-                                move = chess.Move(from_square, square, 
-                                                promotion=chess.Piece.from_symbol(promotion_piece.upper()).piece_type)
+                                move = chess.Move(from_square, square,
+                                                promotion=_PROMOTION_PIECES[promotion_piece])
                             else:
-                                # User canceled, don't make the move
-                                self.selected_square = None
-                                self.valid_moves = []
-                                self.castling_moves = []
-                                self.update_board()
-                                return
+                                # User canceled, don't make the move. The target
+                                # square never holds one of our pieces, so the
+                                # fallback below simply deselects
+                                break
                         except Exception as e:
                             print(f"Error in pawn promotion: {str(e)}")
                             # Default to queen promotion if error
                             move = chess.Move(from_square, square, promotion=chess.QUEEN)
                     
-                    # Check if move is castling
-                    is_castling = piece and piece.piece_type == chess.KING and abs(move.from_square % 8 - move.to_square % 8) > 1
-                    
                     # Get animation info
-                    from_pos = (7 - chess.square_rank(from_square), chess.square_file(from_square))
-                    to_pos = (7 - chess.square_rank(square), chess.square_file(square))
+                    from_pos = _UI_POS[from_square]
+                    to_pos = _UI_POS[square]
                     
                     # Determine piece symbol for animation
-                    piece_symbol = self.piece_symbols.get((piece.piece_type, piece.color), "")
-                    piece_color = "#FFFFFF" if piece.color == chess.WHITE else "#000000"
-                    is_capture = self.board.is_capture(move)
+                    piece_symbol = self.piece_symbols[piece.piece_type]
+                    piece_color = _PIECE_COLORS[piece.color]
+                    is_capture = _is_capture(self.board, move, piece)
                     
-                    # Reset selection
-                    self.selected_square = None
-                    self.valid_moves = []
-                    self.castling_moves = []
+                    # Reset selection, clearing its highlights right away
+                    highlighted = self.move_squares(move)
+                    self.select_square(None)
+                    self.refresh_squares(highlighted)
                     
                     # Switch timer to AI before starting animation
                     if self.is_time_mode:
                         self.switch_timer_to_player('ai')
                     
-                    # Animate move
-                    def after_player_move():
-                        # Execute move on the board
-                        self.board.push(move)
-                        
-                        if self.mode == "human_ai":
-                            self.ai_bot.make_move(move.uci())
-                        
-                        self.apply_time_increment('human')
-                        
-                        # Add to move history
-                        from_uci = chess.square_name(from_square)
-                        to_uci = chess.square_name(square)
-                        is_check = self.board.is_check()
-                        
-                        self.move_history.add_move(
-                            piece, 
-                            from_uci, 
-                            to_uci, 
-                            "White",
-                            is_capture,
-                            is_check,
-                            move.promotion if is_promotion else None,
-                            is_castling
-                        )
-                        
-                        # Update last move highlighting
-                        self.last_move_from = from_pos
-                        self.last_move_to = to_pos
-                        
-                        # Update board display
-                        self.update_board()
-                        
-                        # Check if game is over
-                        if not self.board.is_game_over():
-                            # Switch to AI's turn
-                            self.turn = 'ai'
-
-                            # Update status with "thinking" animation
-                            self.thinking_indicator.start_thinking("AI")
-
-                            # Allow UI to update before AI starts computing
-                            QTimer.singleShot(100, self.ai_move)
-                        else:
-                            if self.is_time_mode:
-                                self.chess_timer.stop_timer()
-                            self.show_game_over_popup()
-                    
                     # Start animation
-                    self.animate_piece_movement(from_pos, to_pos, piece_symbol, piece_color, is_capture, after_player_move)
+                    self.animate_piece_movement(
+                        from_pos, to_pos, piece_symbol, piece_color, is_capture,
+                        partial(self.finish_player_move, move, from_pos, to_pos)
+                    )
                     move_made = True
                     break
             
@@ -1420,21 +1455,58 @@ class ChessBoard(QMainWindow):
                 # If clicking another piece of the same color, select it instead
                 piece = self.board.piece_at(square)
                 if piece and piece.color == self.board.turn:
-                    self.selected_square = current_square
-                    self.valid_moves, self.castling_moves = self.find_valid_moves(current_square)
+                    self.select_square(square)
                 else:
                     # Invalid move - deselect
-                    self.valid_moves = []
-                    self.castling_moves = []
-                    self.selected_square = None
-                
-                self.update_board()
+                    self.select_square(None)
+                dirty = True
+
+        if dirty:
+            self.update_board()
+
+    def finish_player_move(self, move, from_pos, to_pos):
+        """Apply the player's move once its animation has finished"""
+        # Add to move history while the board still shows the position before it
+        self.move_history.add_move(self.board, move, "White")
+
+        # Execute move on the board
+        changed_squares = self.move_squares(move)
+        self.board.push(move)
+        self.update_game_over()
+
+        if self.mode == "human_ai" and self.ai_bot:
+            self.ai_bot.make_move(move.uci())
+
+        self.apply_time_increment('human')
+
+        # Update last move highlighting
+        self.last_move_from = from_pos
+        self.last_move_to = to_pos
+
+        # Update board display
+        self.update_board(changed_squares)
+
+        # Check if game is over
+        if not self.game_over:
+            # Switch to AI's turn
+            self.turn = 'ai'
+
+            # Update status with "thinking" animation
+            self.thinking_indicator.start_thinking("AI")
+
+            # The search runs in the AI worker process, so there is
+            # no need to pad the hand-off; just let this event finish
+            QTimer.singleShot(0, self.ai_move)
+        else:
+            if self.is_time_mode:
+                self.chess_timer.stop_timer()
+            self.show_game_over_popup()
 
     def ai_move(self):
         """Calculate and execute the AI's move using smart time management."""
         try:
             # Check if game is already over
-            if self.board.is_game_over():
+            if self.game_over:
                 self.thinking_indicator.stop_thinking()
                 if self.is_time_mode:
                     self.chess_timer.stop_timer()
@@ -1451,8 +1523,6 @@ class ChessBoard(QMainWindow):
             board_fen = self.board.fen()
             
             # Prepare time management parameters
-            from utils.config import Config
-            
             if self.is_time_mode:
                 # Get current time remaining for both players
                 white_time_ms, black_time_ms = self.chess_timer.get_remaining_times()
@@ -1557,16 +1627,13 @@ class ChessBoard(QMainWindow):
                     self.thinking_indicator.show_status("AI made an invalid move. Your turn.")
                     return
                     
-                from_pos = (7 - chess.square_rank(from_square), chess.square_file(from_square))
-                to_pos = (7 - chess.square_rank(to_square), chess.square_file(to_square))
+                from_pos = _UI_POS[from_square]
+                to_pos = _UI_POS[to_square]
                 
                 # Determine piece symbol and color for animation
-                piece_symbol = self.piece_symbols.get((piece.piece_type, piece.color), "")
-                piece_color = "#FFFFFF" if piece.color == chess.WHITE else "#000000"
-                is_capture = self.board.is_capture(move)
-                
-                # Check if move is castling
-                is_castling = piece and piece.piece_type == chess.KING and abs(move.from_square % 8 - move.to_square % 8) > 1
+                piece_symbol = self.piece_symbols[piece.piece_type]
+                piece_color = _PIECE_COLORS[piece.color]
+                is_capture = _is_capture(self.board, move, piece)
                 
                 # Stop thinking indicator during animation
                 self.thinking_indicator.stop_thinking()
@@ -1575,59 +1642,11 @@ class ChessBoard(QMainWindow):
                 if self.is_time_mode:
                     self.switch_timer_to_player('human')
                 
-                # Animate the move
-                def after_ai_move():
-                    try:
-                        # Execute move on the board
-                        self.board.push(move)
-                        
-                        # Update bot's position to keep it in sync
-                        if self.mode == "human_ai":
-                            self.ai_bot.make_move(move.uci())
-                            
-                        self.apply_time_increment('ai')
-                        
-                        # Add to move history
-                        from_uci = chess.square_name(from_square)
-                        to_uci = chess.square_name(to_square)
-                        is_check = self.board.is_check()
-                        
-                        self.move_history.add_move(
-                            piece, 
-                            from_uci, 
-                            to_uci, 
-                            "Black",
-                            is_capture,
-                            is_check,
-                            move.promotion,
-                            is_castling
-                        )
-                        
-                        # Update last move highlighting
-                        self.last_move_from = from_pos
-                        self.last_move_to = to_pos
-                        
-                        # Update board and switch back to human's turn
-                        self.update_board()
-                        self.turn = 'human'
-
-                        self.thinking_indicator.stop_thinking()
-                        self.thinking_indicator.show_status("Your turn")
-                        
-                        # Check if game is over
-                        if self.board.is_game_over():
-                            if self.is_time_mode:
-                                self.chess_timer.stop_timer()
-                            self.show_game_over_popup()
-                    except Exception as e:
-                        print(f"Error after AI move: {str(e)}")
-                        self.turn = 'human'
-                        if self.is_time_mode:
-                            self.switch_timer_to_player('human')
-                        self.thinking_indicator.show_status("Your turn")
-                
                 # Start animation
-                self.animate_piece_movement(from_pos, to_pos, piece_symbol, piece_color, is_capture, after_ai_move)
+                self.animate_piece_movement(
+                    from_pos, to_pos, piece_symbol, piece_color, is_capture,
+                    partial(self.finish_ai_move, move, from_pos, to_pos)
+                )
             else:
                 self.thinking_indicator.stop_thinking()
                 self.thinking_indicator.show_status("AI could not find a valid move! Your turn.")
@@ -1642,6 +1661,46 @@ class ChessBoard(QMainWindow):
             if self.is_time_mode:
                 self.switch_timer_to_player('human')
 
+    def finish_ai_move(self, move, from_pos, to_pos):
+        """Apply the AI's reply once its animation has finished"""
+        try:
+            # Add to move history while the board still shows the position before it
+            self.move_history.add_move(self.board, move, "Black")
+
+            # Execute move on the board
+            changed_squares = self.move_squares(move)
+            self.board.push(move)
+            self.update_game_over()
+
+            # Update bot's position to keep it in sync
+            if self.mode == "human_ai" and self.ai_bot:
+                self.ai_bot.make_move(move.uci())
+
+            self.apply_time_increment('ai')
+
+            # Update last move highlighting
+            self.last_move_from = from_pos
+            self.last_move_to = to_pos
+
+            # Update board and switch back to human's turn
+            self.update_board(changed_squares)
+            self.turn = 'human'
+
+            self.thinking_indicator.stop_thinking()
+            self.thinking_indicator.show_status("Your turn")
+
+            # Check if game is over
+            if self.game_over:
+                if self.is_time_mode:
+                    self.chess_timer.stop_timer()
+                self.show_game_over_popup()
+        except Exception as e:
+            print(f"Error after AI move: {str(e)}")
+            self.turn = 'human'
+            if self.is_time_mode:
+                self.switch_timer_to_player('human')
+            self.thinking_indicator.show_status("Your turn")
+
     def show_game_over_popup(self, custom_message=None):
         """Show a simple game over popup with retry and home options."""
         try:
@@ -1650,7 +1709,7 @@ class ChessBoard(QMainWindow):
                 self.popup.close()
                 self.popup = None
                     
-            result = self.board.result()
+            result = self.game_result
             
             # Create the new simplified popup
             self.popup = GameOverPopup(result, self, custom_message)
@@ -1725,6 +1784,11 @@ class ChessBoard(QMainWindow):
         except Exception as e:
             print(f"Error applying time increment: {str(e)}")
     
+    def closeEvent(self, event):
+        """Stop the engine process along with the window"""
+        self.ai_manager.shutdown()
+        super().closeEvent(event)
+    
     def resizeEvent(self, event):
         """Handle window resize events to ensure proper layout"""
         super().resizeEvent(event)
@@ -1801,24 +1865,28 @@ class ChessBoard(QMainWindow):
     def undo_move(self):
         """Undo the last move made in the game with improved turn tracking"""
         try:
+            # A move still animating was never pushed; drop it with the undo
+            self.cancel_animations()
+            
             # Check if there are moves to undo
             if len(self.board.move_stack) == 0:
                 self.thinking_indicator.show_status("No moves to undo")
                 return
                 
-            # Store the current board state before undoing
-            previous_fen = self.board.fen()
             current_turn_before_undo = self.board.turn  # Store whose turn it is before undoing
             last_move = self.board.pop()
+            self.update_game_over()
             
             # Update bot position to match the undo
             if self.mode == "human_ai":
                 # Reconstruct the position for the bot
-                self.ai_bot.set_position(fen=self.board.fen())
-            else:
+                if self.ai_bot:
+                    self.ai_bot.set_position(fen=self.board.fen())
+            elif self.ai_bot1:
                 # Update both bots in AI vs AI mode
-                self.ai_bot1.set_position(fen=self.board.fen())
-                self.ai_bot2.set_position(fen=self.board.fen())
+                fen = self.board.fen()
+                self.ai_bot1.set_position(fen=fen)
+                self.ai_bot2.set_position(fen=fen)
             
             # Update the move history
             self.update_move_history_after_undo()
@@ -1842,8 +1910,10 @@ class ChessBoard(QMainWindow):
                     # We need to undo one more move to get back to human's turn
                     if len(self.board.move_stack) > 0:
                         self.board.pop()
+                        self.update_game_over()
                         # Update bot position again
-                        self.ai_bot.set_position(fen=self.board.fen())
+                        if self.ai_bot:
+                            self.ai_bot.set_position(fen=self.board.fen())
                         self.update_move_history_after_undo()
                         self.turn = 'human'
                         if self.is_time_mode:
@@ -1854,12 +1924,10 @@ class ChessBoard(QMainWindow):
                         if self.is_time_mode:
                             self.switch_timer_to_player('ai')
                         
-                # Clear any AI worker if it's running
-                if hasattr(self, 'ai_computation_active') and self.ai_computation_active:
-                    if hasattr(self, 'ai_worker') and self.ai_worker and self.ai_worker.isRunning():
-                        self.ai_worker.terminate()
-                        self.ai_worker = None
-                        self.ai_computation_active = False
+                # Cancel a search for the position that was just undone, so its
+                # reply is never played on the restored board
+                if self.ai_computation_active:
+                    self.stop_thinking()
                         
                 # Ensure we've stopped the thinking indicator
                 if hasattr(self, 'thinking_indicator'):
@@ -1876,13 +1944,13 @@ class ChessBoard(QMainWindow):
                     
             # Update last move highlighting
             if len(self.board.move_stack) > 0:
-                last_move_uci = self.board.move_stack[-1].uci()
-                from_square = chess.parse_square(last_move_uci[:2])
-                to_square = chess.parse_square(last_move_uci[2:4])
+                last_move = self.board.peek()
+                from_square = last_move.from_square
+                to_square = last_move.to_square
                 
                 # Convert to UI coordinates (0-7, 0-7)
-                self.last_move_from = (7 - chess.square_rank(from_square), chess.square_file(from_square))
-                self.last_move_to = (7 - chess.square_rank(to_square), chess.square_file(to_square))
+                self.last_move_from = _UI_POS[from_square]
+                self.last_move_to = _UI_POS[to_square]
             else:
                 # No previous moves, clear highlighting
                 self.last_move_from = None
@@ -1895,7 +1963,6 @@ class ChessBoard(QMainWindow):
             self.thinking_indicator.show_status("Move undone!")
             
             # Update the status message after a short delay
-            from PyQt5.QtCore import QTimer
             QTimer.singleShot(1500, self.update_status_after_undo)
             
         except Exception as e:
@@ -1906,7 +1973,7 @@ class ChessBoard(QMainWindow):
 
     def update_status_after_undo(self):
         """Update the status message after an undo"""
-        if self.board.is_game_over():
+        if self.game_over:
             return
             
         if self.mode == "human_ai":
@@ -1924,42 +1991,8 @@ class ChessBoard(QMainWindow):
             if not hasattr(self, 'move_history'):
                 return
                     
-            # Get the current count of items in the move list
-            move_list = self.move_history.move_list
-            if not move_list:
-                print("Move list is not available")
-                return
-                    
-            count = move_list.count()
-            
-            if count == 0:
-                return
-                    
-            # Get the last item in the list
-            current_item = move_list.item(count - 1)
-            if current_item is None:
-                return
-                    
-            current_text = current_item.text()
-            
-            # Check if the item contains both white and black moves
-            if " (" in current_text and ") " in current_text and ")" not in current_text.split(") ")[0]:
-                try:
-                    # Remove just the black move part (keep white's move)
-                    white_move_part = current_text.split(") ")[0] + ")"
-                    current_item.setText(white_move_part)
-                    # Remove any formatting that was added for combined moves
-                    font = current_item.font()
-                    font.setBold(False)
-                    current_item.setFont(font)
-                except Exception as e:
-                    print(f"Error formatting move text: {str(e)}")
-            else:
-                try:
-                    # Remove the entire item if it's just a white move or already formatted
-                    move_list.takeItem(count - 1)
-                except Exception as e:
-                    print(f"Error removing move item: {str(e)}")
+            # Drop Black's reply from the last row, or the row itself
+            self.move_history.remove_last_move()
         except Exception as e:
             import traceback
             print(f"Error updating move history after undo: {str(e)}")
@@ -2064,12 +2097,10 @@ class ChessBoard(QMainWindow):
     def resign_game(self):
         """Handle the player resigning from the game"""
         try:
-            # Stop any ongoing AI processes
-            if hasattr(self, 'ai_computation_active') and self.ai_computation_active:
-                if hasattr(self, 'ai_worker') and self.ai_worker and self.ai_worker.isRunning():
-                    self.ai_worker.terminate()
-                    self.ai_worker = None
-                    self.ai_computation_active = False
+            # Stop any ongoing AI search; the engine checks the cancel flag as it runs
+            if self.ai_computation_active:
+                self.ai_manager.cancel_computation()
+                self.ai_computation_active = False
                     
             # Stop AI game if running
             if hasattr(self, 'ai_game_running') and self.ai_game_running:
@@ -2097,6 +2128,8 @@ class ChessBoard(QMainWindow):
                     
                     # Force the board into a game over state
                     self.board.set_result(result)
+                    self.game_over = True
+                    self.game_result = result
                     
                     # Update the UI
                     self.thinking_indicator.show_status("You resigned. Game over.")
@@ -2115,6 +2148,8 @@ class ChessBoard(QMainWindow):
                     
                     # Force the board into a game over state
                     self.board.set_result(result)
+                    self.game_over = True
+                    self.game_result = result
                     
                     # Update the UI
                     self.thinking_indicator.show_status("Game resigned")
@@ -3,15 +3,20 @@ Animation components for the chess application.
 This module provides animation utilities for chess piece movements.
 """
 
-from PyQt5.QtWidgets import QLabel, QGraphicsDropShadowEffect
+from PyQt5.QtWidgets import QLabel
 from PyQt5.QtCore import (
     QPropertyAnimation, QEasingCurve, QPoint, QSequentialAnimationGroup, 
     QParallelAnimationGroup, Qt, pyqtSignal
 )
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QPainter, QPalette
 
+from ui.components.board_components import glyph_pixmap
 from utils.config import Config
 
+# Shadow drawn under a moving piece, offset down and to the right
+_SHADOW_COLOR = QColor(0, 0, 0, 160)
+_SHADOW_OFFSET = QPoint(3, 3)
+
 class AnimatedLabel(QLabel):
     """
     Custom QLabel with animation capabilities for chess pieces.
@@ -33,17 +38,29 @@ class AnimatedLabel(QLabel):
         
         # Track animation state
         self._is_animating = False
-        
-        # Add drop shadow for visual depth
-        self._add_shadow()
     
-    def _add_shadow(self):
-        """Add a drop shadow to the piece for better visual appearance."""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        shadow.setOffset(3, 3)
-        self.setGraphicsEffect(shadow)
+    def paintEvent(self, event):
+        """Draw a shadow under the piece, then the piece itself.
+        
+        Both are blitted from the shared glyph cache, so the frames of a move
+        never lay out text, and painting the shadow here rather than through
+        a QGraphicsEffect keeps the label on the normal raster path.
+        """
+        symbol = self.text()
+        if not symbol:
+            return
+        size = min(self.width(), self.height())
+        ratio = self.devicePixelRatioF()
+        font = self.font()
+        x = (self.width() - size) // 2
+        y = (self.height() - size) // 2
+        
+        painter = QPainter(self)
+        painter.drawPixmap(x + _SHADOW_OFFSET.x(), y + _SHADOW_OFFSET.y(),
+                           glyph_pixmap(symbol, _SHADOW_COLOR, font, size, ratio))
+        painter.drawPixmap(x, y, glyph_pixmap(symbol, self.palette().color(QPalette.WindowText),
+                                              font, size, ratio))
+        painter.end()
         
     def move_to(self, target_pos, duration=None):
         """
@@ -3,27 +3,138 @@ Chess board UI components.
 This module provides the UI components for the chess board display.
 """
 
-from PyQt5.QtWidgets import QLabel, QGraphicsOpacityEffect, QSizePolicy
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QRect, QEvent, QPoint
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QResizeEvent
+from PyQt5.QtWidgets import QLabel, QWidget, QSizePolicy, QStyle, QStyleOption
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QRect, QRectF, QPoint
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QResizeEvent, QPixmap, QFont
 
 from utils.config import Config
 
-class ChessSquare(QLabel):
-    """Enhanced chess square widget with hover and selection effects."""
+# Checkerboard colors indexed by the square parity
+_SQUARE_COLORS = (QColor(Config.LIGHT_SQUARE_COLOR), QColor(Config.DARK_SQUARE_COLOR))
+_SELECTED_COLOR = QColor(Config.SELECTED_SQUARE_COLOR)
+_LAST_MOVE_COLOR = QColor(Config.LAST_MOVE_COLOR)
+
+# Pens and brushes for the move indicators
+_VALID_MOVE_PEN = QPen(QColor(Config.VALID_MOVE_COLOR), 2)
+_VALID_MOVE_BRUSH = QBrush(QColor(Config.VALID_MOVE_COLOR).lighter(160))
+_CASTLING_MOVE_PEN = QPen(QColor(Config.CASTLING_MOVE_COLOR), 2)
+_CASTLING_MOVE_BRUSH = QBrush(QColor(Config.CASTLING_MOVE_COLOR).lighter(160))
+_EN_PASSANT_PEN = QPen(QColor(Config.EN_PASSANT_COLOR), 2)
+_EN_PASSANT_BRUSH = QBrush(QColor(Config.EN_PASSANT_COLOR).lighter(160))
+_EN_PASSANT_DIAMOND_PEN = QPen(QColor(Config.EN_PASSANT_COLOR).darker(150), 1)
+
+# Semi-transparent red border for a king in check
+_CHECK_COLOR = QColor(Config.CHECK_COLOR)
+_CHECK_COLOR.setAlpha(150)
+_CHECK_PEN = QPen(_CHECK_COLOR, 3)
+
+# Hovered squares are washed with the board background, the same blend a
+# 0.8 opacity effect over the board widget used to produce
+_HOVER_WASH = QColor(0x45, 0x5a, 0x64, 51)
+
+# Pre-rendered piece glyphs keyed by (symbol, color, font, size, pixel ratio)
+_GLYPH_CACHE = {}
+_GLYPH_CACHE_LIMIT = 128  # Every piece at a few board sizes, plus the move overlay
+
+def glyph_pixmap(symbol, color, font, size, ratio):
+    """Return a transparent size x size pixmap with the piece glyph drawn centered.
     
-    clicked = pyqtSignal(int, int)
+    Text shaping only happens the first time a glyph is requested at a given
+    size; afterwards squares just blit the cached pixmap.
+    """
+    key = (symbol, color.rgba(), font.key(), size, ratio)
+    pixmap = _GLYPH_CACHE.get(key)
+    if pixmap is None:
+        # Old sizes are useless after a resize, so just start over
+        if len(_GLYPH_CACHE) >= _GLYPH_CACHE_LIMIT:
+            _GLYPH_CACHE.clear()
+        
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, symbol)
+        painter.end()
+        _GLYPH_CACHE[key] = pixmap
+    return pixmap
+
+# File and rank labels drawn around the board
+_COORDINATE_FONT = QFont("Arial", 12, QFont.Bold)
+_COORDINATE_COLOR = QColor("white")
+_FILE_NAMES = "abcdefgh"
+
+class BoardWidget(QWidget):
+    """Container of the 64 squares that also draws the board coordinates.
+    
+    The squares fill an 8x8 block of a 9x9 grid; the file letters go in the
+    extra row below it and the rank numbers in the extra column to its right,
+    painted here in one pass instead of by sixteen label widgets.
+    """
+    
+    def paintEvent(self, event):
+        """Paint the styled background, then the file and rank labels."""
+        painter = QPainter(self)
+        
+        # Let the stylesheet draw the background and rounded corners
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        
+        # SquareGridLayout places the squares itself and never reports a
+        # geometry of its own, so take the grid origin and the cell size
+        # from the a8 square in its top-left corner
+        layout = self.layout()
+        corner = layout.itemAtPosition(0, 0) if layout is not None else None
+        if corner is not None and corner.widget() is not None:
+            first = corner.widget().geometry()
+            cell = first.width()
+            if cell > 0:
+                painter.setFont(_COORDINATE_FONT)
+                painter.setPen(_COORDINATE_COLOR)
+                x, y = first.x(), first.y()
+                for index in range(8):
+                    painter.drawText(QRect(x + index * cell, y + 8 * cell, cell, cell),
+                                     Qt.AlignCenter, _FILE_NAMES[index])
+                    painter.drawText(QRect(x + 8 * cell, y + index * cell, cell, cell),
+                                     Qt.AlignCenter, str(8 - index))
+        painter.end()
+
+class ChessSquare(QWidget):
+    """Enhanced chess square widget with hover and selection effects.
+    
+    The square paints its background, border, piece glyph and move
+    indicators itself with a single QPainter, so a refresh never goes
+    through the stylesheet or QLabel text machinery.
+    """
+    
+    clicked = pyqtSignal(int)  # python-chess square index
     
     def __init__(self, row, col, parent=None):
         super().__init__(parent)
         self.row = row
         self.col = col
-        self.setAlignment(Qt.AlignCenter)
+        # python-chess square index (a1 = 0), row 0 being the 8th rank
+        self.square = (7 - row) * 8 + col
         
         # Ensure the square remains square by using a special size policy
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(40, 40)  # Minimum size for small screens
         
+        # Every pixel is painted in paintEvent
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        font = self.font()
+        font.setBold(True)
+        self.setFont(font)
+        
+        # What to draw
+        self.symbol = ""
+        self.piece_color = None
+        # The square's own checkerboard color never changes
+        self.square_color = _SQUARE_COLORS[(row + col) & 1]
+        self.base_color = self.square_color
+        
         # Initialize states
         self.is_highlighted = False
         self.is_last_move = False
@@ -33,36 +144,13 @@ class ChessSquare(QLabel):
         self.is_selected = False
         self.is_checked = False  # For check highlighting
         
-        # Store the effect as an instance variable to prevent deletion
-        self.hover_effect = None
-        
-        # Install event filter to maintain square aspect ratio
-        self.installEventFilter(self)
-        
-    def eventFilter(self, obj, event):
-        """Event filter to maintain square aspect ratio."""
-        if (obj is self and event.type() == QEvent.Resize):
-            # Calculate new size to maintain square aspect ratio
-            size = min(self.width(), self.height())
-            if size > 0:
-                # Update font size based on the square size
-                font = self.font()
-                font.setPointSize(max(8, size // 2))  # Font size as 50% of square size, min 8pt
-                self.setFont(font)
-            
-            # Let the resize event propagate normally
-            return False
-        return super().eventFilter(obj, event)
         
     def enterEvent(self, event):
         """Highlight square on mouse hover."""
         try:
             if not self.is_selected and not self.is_last_move and not self.is_highlighted:
-                # Create a new effect only if we don't have one
-                self.hover_effect = QGraphicsOpacityEffect(self)
-                self.hover_effect.setOpacity(0.8)
-                self.setGraphicsEffect(self.hover_effect)
                 self.is_highlighted = True
+                self.update()
         except Exception as e:
             print(f"Error in enterEvent: {str(e)}")
         super().enterEvent(event)
@@ -71,9 +159,8 @@ class ChessSquare(QLabel):
         """Remove highlight on mouse leave."""
         try:
             if self.is_highlighted:
-                # Don't delete the effect, just remove it from the widget
-                self.setGraphicsEffect(None)
                 self.is_highlighted = False
+                self.update()
         except Exception as e:
             print(f"Error in leaveEvent: {str(e)}")
         super().leaveEvent(event)
@@ -81,24 +168,35 @@ class ChessSquare(QLabel):
     def mousePressEvent(self, event):
         """Handle mouse click on square."""
         try:
-            # Ensure no highlight effect remains after clicking
+            # Ensure no hover highlight remains after clicking
             if self.is_highlighted:
-                self.setGraphicsEffect(None)
                 self.is_highlighted = False
+                self.update()
         except Exception as e:
             print(f"Error in mousePressEvent: {str(e)}")
-        self.clicked.emit(self.row, self.col)
+        self.clicked.emit(self.square)
         super().mousePressEvent(event)
 
     def paintEvent(self, event):
-        """Custom painting for the square to include circular indicators."""
-        # Call the parent's paintEvent to ensure proper rendering
-        super().paintEvent(event)
-        
-        # Draw indicators for valid moves, castling, en passant, and check
-        if self.is_valid_move or self.is_castling_move or self.is_checked or self.is_en_passant_move:
-            try:
-                painter = QPainter(self)
+        """Paint the square, its piece and any move or check indicators."""
+        painter = QPainter(self)
+        try:
+            rect = self.rect()
+            
+            # Square background and border
+            painter.fillRect(rect, self.base_color)
+            painter.setPen(Qt.black)
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            
+            # Piece glyph, blitted from the shared cache
+            if self.symbol:
+                size = min(rect.width(), rect.height())
+                pixmap = glyph_pixmap(self.symbol, self.piece_color, self.font(),
+                                      size, self.devicePixelRatioF())
+                painter.drawPixmap((rect.width() - size) // 2, (rect.height() - size) // 2, pixmap)
+            
+            # Draw indicators for valid moves, castling, en passant, and check
+            if self.is_valid_move or self.is_castling_move or self.is_checked or self.is_en_passant_move:
                 painter.setRenderHint(QPainter.Antialiasing)
                 
                 square_width = self.width()
@@ -112,28 +210,25 @@ class ChessSquare(QLabel):
                 
                 # Draw circular indicators for valid moves
                 if self.is_valid_move:
-                    painter.setPen(QPen(QColor(Config.VALID_MOVE_COLOR), 2))
-                    painter.setBrush(QBrush(QColor(Config.VALID_MOVE_COLOR).lighter(160)))
-                    # Use integers for all parameters
+                    painter.setPen(_VALID_MOVE_PEN)
+                    painter.setBrush(_VALID_MOVE_BRUSH)
                     painter.drawEllipse(x_pos, y_pos, indicator_size_int, indicator_size_int)
                 
                 # Draw different indicator for castling
                 elif self.is_castling_move:
-                    painter.setPen(QPen(QColor(Config.CASTLING_MOVE_COLOR), 2))
-                    painter.setBrush(QBrush(QColor(Config.CASTLING_MOVE_COLOR).lighter(160)))
-                    # Use integers for all parameters
+                    painter.setPen(_CASTLING_MOVE_PEN)
+                    painter.setBrush(_CASTLING_MOVE_BRUSH)
                     painter.drawEllipse(x_pos, y_pos, indicator_size_int, indicator_size_int)
                 
                 # Draw unique indicator for en passant
                 elif self.is_en_passant_move:
-                    painter.setPen(QPen(QColor(Config.EN_PASSANT_COLOR), 2))
-                    painter.setBrush(QBrush(QColor(Config.EN_PASSANT_COLOR).lighter(160)))
-                    # Use integers for all parameters
+                    painter.setPen(_EN_PASSANT_PEN)
+                    painter.setBrush(_EN_PASSANT_BRUSH)
                     painter.drawEllipse(x_pos, y_pos, indicator_size_int, indicator_size_int)
                     
                     # Add a distinctive diamond shape for en passant
                     diamond_size = int(indicator_size * 0.7)  # Convert to int
-                    painter.setPen(QPen(QColor(Config.EN_PASSANT_COLOR).darker(150), 1))
+                    painter.setPen(_EN_PASSANT_DIAMOND_PEN)
                     
                     # Calculate diamond points
                     center_x = x_pos + indicator_size_int // 2
@@ -151,14 +246,10 @@ class ChessSquare(QLabel):
                     # Draw the diamond
                     painter.drawPolygon(points)
                 
-                # Draw red highlight for check - but make it semi-transparent
+                # Draw red highlight for check
                 if self.is_checked:
-                    # Use semi-transparent color for the check highlight
-                    check_color = QColor(Config.CHECK_COLOR)
-                    check_color.setAlpha(150)  # Make it semi-transparent
-                    
-                    painter.setPen(QPen(check_color, 3))
-                    painter.setBrush(QBrush())  # No fill, just border
+                    painter.setPen(_CHECK_PEN)
+                    painter.setBrush(Qt.NoBrush)  # No fill, just border
                     
                     # Draw border around the entire square
                     border_padding = 2
@@ -168,41 +259,53 @@ class ChessSquare(QLabel):
                         self.width() - 2 * border_padding, 
                         self.height() - 2 * border_padding
                     )
-                
-                # Make sure to end painting
-                painter.end()
-            except Exception as e:
-                print(f"Error in paintEvent: {str(e)}")
+            
+            # Hover highlight over everything drawn so far
+            if self.is_highlighted:
+                painter.fillRect(rect, _HOVER_WASH)
+        except Exception as e:
+            print(f"Error in paintEvent: {str(e)}")
+        finally:
+            # Make sure to end painting
+            painter.end()
+    
+    def set_piece(self, symbol, piece_color=None):
+        """Set the piece glyph shown on this square.
+        
+        Args:
+            symbol (str): Unicode piece symbol, or an empty string
+            piece_color (QColor, optional): Color to draw the symbol in
+        """
+        self.symbol = symbol
+        self.piece_color = piece_color
         
     def update_appearance(self):
         """Update the square's appearance based on its state."""
         # Determine base color based on square position and state
         if self.is_selected:
-            base_color = Config.SELECTED_SQUARE_COLOR
+            self.base_color = _SELECTED_COLOR
         elif self.is_last_move:
-            base_color = Config.LAST_MOVE_COLOR
+            self.base_color = _LAST_MOVE_COLOR
         else:
             # Regular checkerboard pattern
-            base_color = Config.LIGHT_SQUARE_COLOR if (self.row + self.col) % 2 == 0 else Config.DARK_SQUARE_COLOR
+            self.base_color = self.square_color
         
-        # Reset any highlight effect if state changed
-        try:
-            if (self.is_selected or self.is_last_move) and self.is_highlighted:
-                self.setGraphicsEffect(None)
-                self.is_highlighted = False
-        except Exception as e:
-            print(f"Error in update_appearance: {str(e)}")
-            
-        # Set the base color of the square
-        self.setStyleSheet(f"background-color: {base_color}; border: 1px solid black;")
+        # Selected and last-move squares are never shown hovered
+        if self.is_selected or self.is_last_move:
+            self.is_highlighted = False
         
-        # Trigger a repaint for the indicators
+        # Trigger a repaint
         self.update()
     
     def resizeEvent(self, event: QResizeEvent):
         """Handle resize events to adjust font size for pieces."""
         super().resizeEvent(event)
-        # Resize logic is now handled in the event filter
+        size = min(self.width(), self.height())
+        if size > 0:
+            # Font size as 50% of square size, min 8pt
+            font = self.font()
+            font.setPointSize(max(8, size // 2))
+            self.setFont(font)
 
     def sizeHint(self):
         """Provide the preferred size for layout management."""
@@ -220,6 +323,24 @@ class ChessSquare(QLabel):
         """Ensure height equals width to maintain square aspect ratio."""
         return width
 
+# Indicator stylesheet. The background is painted in paintEvent so the
+# pulse animation never has to touch the stylesheet.
+_INDICATOR_STYLE = """
+            color: white;
+            background-color: transparent;
+            border-radius: 10px;
+            padding: 10px;
+            border: 2px solid #3498db;
+            margin: 0px;
+        """
+_INDICATOR_BACKGROUND = QColor(52, 73, 94)
+_INDICATOR_TEXT_COLOR = QColor("white")
+_INDICATOR_FONT = QFont("Arial", 16, QFont.Bold)
+# One timer drives the thinking animation: the background pulses every
+# frame and the dots advance every few frames
+_PULSE_INTERVAL = 100  # ms
+_FRAMES_PER_DOT = max(1, Config.THINKING_DOT_INTERVAL // _PULSE_INTERVAL)
+
 class ThinkingIndicator(QLabel):
     """Visual indicator for both game status and AI thinking state."""
     
@@ -227,49 +348,48 @@ class ThinkingIndicator(QLabel):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: white;
-            background-color: rgba(52, 73, 94, 0.9);
-            border-radius: 10px;
-            padding: 10px;
-            border: 2px solid #3498db;
-            margin: 0px;
-        """)
+        self.setFont(_INDICATOR_FONT)
+        self.setStyleSheet(_INDICATOR_STYLE)
         self.setFixedHeight(50)
         self.dots = 0
+        self.frame = 0
+        self.base_text = ""
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_dots)
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.pulse_effect)
+        self.timer.timeout.connect(self.next_frame)
         self.opacity = 0.9
         self.opacity_increasing = False
+        # Reused for every frame; only its alpha follows the pulse
+        self.background = QColor(_INDICATOR_BACKGROUND)
         self.hide()
         
     def start_thinking(self, ai_name):
         """Start the thinking animation with pulsing effect."""
-        self.base_text = f"{ai_name} is thinking"
+        base_text = f"{ai_name} is thinking"
+        # Already animating this text; restarting would only reset the dots
+        if self.timer.isActive() and self.isVisible() and base_text == self.base_text:
+            return
+        
+        self.base_text = base_text
         self.dots = 0
-        self.setText(f"{self.base_text}...")
+        self.frame = 0
+        # The animated text is drawn in paintEvent
+        self.setText("")
         self.show()
-        self.timer.start(Config.THINKING_DOT_INTERVAL)  # Update dots interval
-        self.animation_timer.start(100)  # Pulse animation frames
+        self.timer.start(_PULSE_INTERVAL)
+        self.update()
         
     def stop_thinking(self):
         """Stop all animations and hide the indicator."""
         self.timer.stop()
-        self.animation_timer.stop()
         self.hide()
         
-    def update_dots(self):
-        """Update the thinking dots animation."""
-        self.dots = (self.dots + 1) % 4
-        dot_text = "." * self.dots
-        self.setText(f"{self.base_text}{dot_text.ljust(3)}")
+    def next_frame(self):
+        """Advance the thinking animation: pulse the background, step the dots."""
+        self.frame += 1
+        if self.frame % _FRAMES_PER_DOT == 0:
+            self.dots = (self.dots + 1) % 4
         
-    def pulse_effect(self):
-        """Create a subtle pulsing effect by changing opacity."""
+        # Create a subtle pulsing effect by changing opacity
         if self.opacity_increasing:
             self.opacity += 0.03
             if self.opacity >= 0.95:
@@ -278,40 +398,47 @@ class ThinkingIndicator(QLabel):
             self.opacity -= 0.03
             if self.opacity <= 0.75:
                 self.opacity_increasing = True
-                
-        # Update the stylesheet with new opacity
-        self.setStyleSheet(f"""
-            font-size: 16pt;
-            font-weight: bold;
-            color: white;
-            background-color: rgba(52, 73, 94, {self.opacity});
-            border-radius: 10px;
-            padding: 10px;
-            border: 2px solid #3498db;
-            margin: 0px;
-        """)
+        
+        # Repaint with the new background opacity
+        self.update()
+        
+    def paintEvent(self, event):
+        """Paint the background at the current opacity, then the label itself."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        self.background.setAlpha(int(self.opacity * 255))
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 10, 10)
+        painter.end()
+        
+        # Border and any static status text come from the stylesheet
+        super().paintEvent(event)
+        
+        # Thinking text with its animated dots
+        if self.timer.isActive():
+            painter = QPainter(self)
+            painter.setPen(_INDICATOR_TEXT_COLOR)
+            painter.setFont(self.font())
+            painter.drawText(self.contentsRect(), Qt.AlignCenter,
+                             f"{self.base_text}{('.' * self.dots).ljust(3)}")
+            painter.end()
         
     # New method to display status messages
     def show_status(self, message):
         """Show a status message without animation effects."""
+        # The board refreshes the status on every redraw, so most calls
+        # repeat the message that is already on screen
+        if not self.timer.isActive() and self.isVisible() and message == self.text():
+            return
+        
         # Stop any ongoing animations
         self.timer.stop()
-        self.animation_timer.stop()
+        self.opacity = 0.9
         
         # Set the text directly
         self.setText(message)
         
         # Show the indicator
         self.show()
-        
-        # Apply non-animated style
-        self.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: white;
-            background-color: rgba(52, 73, 94, 0.9);
-            border-radius: 10px;
-            padding: 10px;
-            border: 2px solid #3498db;
-            margin: 0px;
-        """)
\ No newline at end of file
+        self.update()
@@ -12,12 +12,18 @@ from PyQt5.QtGui import QIcon, QColor
 
 from utils.config import Config
 
+# Drop shadow color shared by the control buttons
+_BUTTON_SHADOW_COLOR = QColor(0, 0, 0, 70)
+
 class ControlButton(QPushButton):
     """Enhanced button with better visual feedback."""
     
     def __init__(self, text, color, icon=None, parent=None):
         super().__init__(text, parent)
         self.base_color = color
+        # The hover and pressed shades only depend on the base color
+        self.hover_color = self._lighten_color(color, 1.1)
+        self.pressed_color = self._darken_color(color, 1.1)
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(50)  # Base height
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -42,10 +48,10 @@ class ControlButton(QPushButton):
                 text-align: center;
             }}
             QPushButton:hover {{
-                background-color: {self._lighten_color(self.base_color, 1.1)};
+                background-color: {self.hover_color};
             }}
             QPushButton:pressed {{
-                background-color: {self._darken_color(self.base_color, 1.1)};
+                background-color: {self.pressed_color};
             }}
             QPushButton:disabled {{
                 background-color: #bbbbbb;
@@ -56,27 +62,17 @@ class ControlButton(QPushButton):
         # Add drop shadow effect for depth (instead of box-shadow)
         shadow = QGraphicsDropShadowEffect(self)
         shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 70))
+        shadow.setColor(_BUTTON_SHADOW_COLOR)
         shadow.setOffset(0, 5)
         self.setGraphicsEffect(shadow)
     
     def _lighten_color(self, color, factor):
         """Lighten a hex color by a given factor."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = min(255, int(int(color[0:2], 16) * factor))
-        g = min(255, int(int(color[2:4], 16) * factor))
-        b = min(255, int(int(color[4:6], 16) * factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).lighter(round(factor * 100)).name()
     
     def _darken_color(self, color, factor):
         """Darken a hex color by a given factor."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = max(0, int(int(color[0:2], 16) / factor))
-        g = max(0, int(int(color[2:4], 16) / factor))
-        b = max(0, int(int(color[4:6], 16) / factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).darker(round(factor * 100)).name()
     
     def sizeHint(self):
         """Return the preferred size for the button."""
@@ -236,27 +232,17 @@ class UndoButton(QPushButton):
         # Add drop shadow effect
         shadow = QGraphicsDropShadowEffect(self)
         shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 70))
+        shadow.setColor(_BUTTON_SHADOW_COLOR)
         shadow.setOffset(0, 5)
         self.setGraphicsEffect(shadow)
     
     def _lighten_color(self, color, factor=1.1):
         """Lighten a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = min(255, int(int(color[0:2], 16) * factor))
-        g = min(255, int(int(color[2:4], 16) * factor))
-        b = min(255, int(int(color[4:6], 16) * factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).lighter(round(factor * 100)).name()
     
     def _darken_color(self, color, factor=1.1):
         """Darken a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = max(0, int(int(color[0:2], 16) / factor))
-        g = max(0, int(int(color[2:4], 16) / factor))
-        b = max(0, int(int(color[4:6], 16) / factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).darker(round(factor * 100)).name()
     
     def sizeHint(self):
         """Return the preferred size for the button."""
@@ -303,27 +289,17 @@ class ResignButton(QPushButton):
         # Add drop shadow effect
         shadow = QGraphicsDropShadowEffect(self)
         shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 70))
+        shadow.setColor(_BUTTON_SHADOW_COLOR)
         shadow.setOffset(0, 5)
         self.setGraphicsEffect(shadow)
     
     def _lighten_color(self, color, factor=1.1):
         """Lighten a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = min(255, int(int(color[0:2], 16) * factor))
-        g = min(255, int(int(color[2:4], 16) * factor))
-        b = min(255, int(int(color[4:6], 16) * factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).lighter(round(factor * 100)).name()
     
     def _darken_color(self, color, factor=1.1):
         """Darken a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = max(0, int(int(color[0:2], 16) / factor))
-        g = max(0, int(int(color[2:4], 16) / factor))
-        b = max(0, int(int(color[4:6], 16) / factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).darker(round(factor * 100)).name()
     
     def sizeHint(self):
         """Return the preferred size for the button."""
@@ -4,13 +4,78 @@ This module provides a widget to display the move history with proper chess nota
 """
 
 from PyQt5.QtWidgets import (
-    QFrame, QVBoxLayout, QLabel, QListWidget, QListWidgetItem,
+    QFrame, QVBoxLayout, QLabel, QListView,
     QSizePolicy, QScrollArea
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
 from PyQt5.QtGui import QBrush, QColor, QFont
 import chess
 
+# Row colors for moves that start a new line in the list
+_WHITE_MOVE_BRUSH = QBrush(QColor("#0000aa"))  # Dark blue for white's moves
+_BLACK_MOVE_BRUSH = QBrush(QColor("#000000"))  # Black for black's moves
+
+# Fonts shared by every history widget, so the stylesheets carry no font rules
+_TITLE_FONT = QFont("Arial", 16, QFont.Bold)
+_MOVE_FONT = QFont("Arial", 14)
+# Rows holding both moves of a turn are shown in bold
+_FULL_TURN_FONT = QFont("Arial", 14, QFont.Bold)
+
+class MoveHistoryModel(QAbstractListModel):
+    """One row per turn, holding the row's own text and Black's reply if any."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [text, black reply or None, foreground brush or None]
+        self._rows = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, black, brush = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            # Format: "1. e4 (e2-e4)    Nc6 (b8-c6)"
+            return text if black is None else f"{text.ljust(25)} {black}"
+        if role == Qt.ForegroundRole:
+            return brush
+        if role == Qt.FontRole and black is not None:
+            return _FULL_TURN_FONT
+        return None
+    
+    def append_row(self, text, brush):
+        """Start a new row."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([text, None, brush])
+        self.endInsertRows()
+        
+    def set_black_reply(self, text):
+        """Set or clear (with None) Black's reply on the last row."""
+        row = len(self._rows) - 1
+        self._rows[row][1] = text
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        
+    def last_has_black_reply(self):
+        """Check if the last row already holds a Black reply."""
+        return bool(self._rows) and self._rows[-1][1] is not None
+    
+    def remove_last_row(self):
+        """Drop the last row."""
+        row = len(self._rows) - 1
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._rows.pop()
+        self.endRemoveRows()
+        
+    def clear(self):
+        """Drop every row."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
 class MoveHistoryWidget(QFrame):
     """Widget to display the move history with improved contrast and proper chess notation."""
     
@@ -18,13 +83,7 @@ class MoveHistoryWidget(QFrame):
         super().__init__(parent)
         self.setFrameShape(QFrame.StyledPanel)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #cccccc;
-            }
-        """)
+        self.setObjectName("moveHistory")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -32,25 +91,15 @@ class MoveHistoryWidget(QFrame):
         
         # Title container with improved visibility
         title_container = QFrame()
-        title_container.setStyleSheet("""
-            QFrame {
-                background-color: #34495e;
-                border-radius: 6px;
-                border: 1px solid #1a2530;
-            }
-        """)
+        title_container.setObjectName("moveHistoryTitleBar")
         
         title_layout = QVBoxLayout(title_container)
         
         # Title label
         title = QLabel("Move History")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("""
-            font-size: 16pt; 
-            font-weight: bold; 
-            color: white; 
-            padding: 5px;
-        """)
+        title.setFont(_TITLE_FONT)
+        title.setObjectName("moveHistoryTitle")
         title_layout.addWidget(title)
         layout.addWidget(title_container)
         
@@ -59,184 +108,86 @@ class MoveHistoryWidget(QFrame):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
+        scroll_area.setObjectName("moveHistoryScroll")
         
-        # Custom styled list widget
-        self.move_list = QListWidget()
-        self.move_list.setStyleSheet("""
-            QListWidget {
-                background-color: #ffffff;
-                alternate-background-color: #f0f0f0;
-                font-size: 14pt;
-                font-family: 'Arial', sans-serif;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                color: #222222;
-                padding: 5px;
-                border-bottom: 1px solid #e0e0e0;
-                min-height: 30px;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #e6f7ff;
-            }
-            QListWidget::item:alternate {
-                background-color: #f5f5f5;
-            }
-        """)
+        # Custom styled list view over the history model
+        self.model = MoveHistoryModel(self)
+        self.move_list = QListView()
+        self.move_list.setModel(self.model)
+        self.move_list.setUniformItemSizes(True)
+        self.move_list.setFont(_MOVE_FONT)
+        self.move_list.setObjectName("moveHistoryList")
         self.move_list.setAlternatingRowColors(True)
         
+        # Scrolling is deferred to the event loop so a burst of moves (a
+        # loaded game or a fast AI game) relayouts the list only once
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(0)
+        self.scroll_timer.timeout.connect(self.move_list.scrollToBottom)
+        
         scroll_area.setWidget(self.move_list)
         layout.addWidget(scroll_area)
         
     # Update the MoveHistoryWidget.add_move method to improve the format
 
-    def add_move(self, piece, from_square, to_square, color="White", capture=False, 
-              check=False, promotion=None, castling=False, en_passant=False):
+    def add_move(self, board, move, color="White"):
         """
         Add a move to the history with proper chess notation and improved formatting.
         
         Args:
-            piece (chess.Piece): The chess piece being moved
-            from_square (str): UCI notation for the source square (e.g., "e2")
-            to_square (str): UCI notation for the destination square (e.g., "e4")
+            board (chess.Board): The position before the move is played
+            move (chess.Move): The move being added
             color (str): "White" or "Black" to indicate which player moved
-            capture (bool): Whether the move captured a piece
-            check (bool): Whether the move gives check
-            promotion (int): Chess piece type for pawn promotion (if applicable)
-            castling (bool): Whether the move is castling
-            en_passant (bool): Whether the move is an en passant capture
         """
+        from_square = chess.square_name(move.from_square)
+        to_square = chess.square_name(move.to_square)
         try:
-            # Map chess piece types to standard notation symbols
-            piece_symbols = {
-                chess.PAWN: "",
-                chess.KNIGHT: "N",
-                chess.BISHOP: "B",
-                chess.ROOK: "R",
-                chess.QUEEN: "Q",
-                chess.KING: "K"
-            }
-            
-            # Map promotion piece types to notation symbols
-            promotion_symbols = {
-                chess.QUEEN: "Q",
-                chess.ROOK: "R", 
-                chess.BISHOP: "B",
-                chess.KNIGHT: "N"
-            }
-            
-            notation = ""
+            # Standard algebraic notation, including disambiguation, castling,
+            # promotion and the check or mate suffix
+            notation = board.san(move)
             enhanced_format = f"{from_square}-{to_square}"
             
-            # Handle castling notation
-            if castling:
-                # King-side castling (moving right)
-                if ord(to_square[0]) > ord(from_square[0]):
-                    notation += "O-O"  # King-side
-                else:
-                    notation += "O-O-O"  # Queen-side
-            else:
-                # Add piece symbol (except for pawns)
-                notation += piece_symbols.get(piece.piece_type, "")
-                
-                # Add source file for pawns making a capture
-                if capture and piece.piece_type == chess.PAWN:
-                    notation += from_square[0]
-                
-                # Add capture symbol if needed
-                if capture or en_passant:
-                    notation += "x"
-                    
-                # Add destination square
-                notation += to_square
-                
-                # Add en passant annotation
-                if en_passant:
-                    notation += " e.p."
-                
-                # Add promotion piece
-                if promotion:
-                    notation += "=" + promotion_symbols.get(promotion, "Q")
-                    
-            # Add check/checkmate symbol
-            if check:
-                notation += "+"  # For simplicity, we use + for check
-            
+            model = self.model
             if color == "White":
                 # Calculate next move number - this is the sequential move number
-                move_number = self.move_list.count() + 1
+                move_number = model.rowCount() + 1
                 
-                # Create new item for White's move
-                item = QListWidgetItem(f"{move_number}. {notation.ljust(8)} ({enhanced_format})")
-                item_color = "#0000aa"  # Dark blue for white's moves
-                item.setForeground(QBrush(QColor(item_color)))
-                self.move_list.addItem(item)
+                # Create new row for White's move
+                model.append_row(f"{move_number}. {notation.ljust(8)} ({enhanced_format})",
+                                 _WHITE_MOVE_BRUSH)
+            elif model.rowCount() and not model.last_has_black_reply():
+                # For Black's move, we append to the last row, shown in bold
+                model.set_black_reply(f"{notation} ({enhanced_format})")
             else:
-                # For Black's move, we append to the last item
-                current_item = self.move_list.item(self.move_list.count() - 1)
-                if current_item:
-                    current_text = current_item.text()
-                    # Format: "1. e4 (e2-e4)    Nc6 (b8-c6)"
-                    combined_text = f"{current_text.ljust(25)} {notation} ({enhanced_format})"
-                    current_item.setText(combined_text)
-                    
-                    # Apply custom styling with a bold font
-                    font = current_item.font()
-                    font.setBold(True)
-                    current_item.setFont(font)
-                else:
-                    # If there's no white move (unlikely but possible in custom positions),
-                    # create a new item for black's move
-                    move_number = self.move_list.count() + 1
-                    item = QListWidgetItem(f"{move_number}. ... {notation} ({enhanced_format})")
-                    item_color = "#000000"  # Black for black's moves
-                    item.setForeground(QBrush(QColor(item_color)))
-                    self.move_list.addItem(item)
+                # If there's no white move (unlikely but possible in custom positions),
+                # create a new row for black's move
+                move_number = model.rowCount() + 1
+                model.append_row(f"{move_number}. ... {notation} ({enhanced_format})",
+                                 _BLACK_MOVE_BRUSH)
                 
             # Scroll to the bottom to show the latest move
-            self.move_list.scrollToBottom()
+            self.scroll_timer.start()
         except Exception as e:
             print(f"Error adding move to history: {str(e)}")
             # Add a fallback entry if normal notation fails
-            move_number = (self.move_list.count() // 2) + 1
+            move_number = self.model.rowCount() + 1
             if color == "White":
-                self.move_list.addItem(f"{move_number}. {from_square}-{to_square}")
+                self.model.append_row(f"{move_number}. {from_square}-{to_square}", None)
             else:
-                self.move_list.addItem(f"... {from_square}-{to_square}")
+                self.model.append_row(f"... {from_square}-{to_square}", None)
 
     def clear_history(self):
         """Clear the move history."""
-        self.move_list.clear()
+        self.model.clear()
         
     def remove_last_move(self):
         """Remove the last move from the history."""
-        count = self.move_list.count()
-        if count > 0:
-            last_item = self.move_list.item(count - 1)
-            text = last_item.text()
-            
-            # Check if the last item has both white and black moves
-            if " " in text and not text.startswith(f"{count}."):
-                # Extract just the white move part (keep first part before space)
-                white_move = text.split(" ", 1)[0]
-                last_item.setText(white_move)
-                
-                # Reset formatting for item with only white's move
-                font = last_item.font()
-                font.setBold(False)
-                last_item.setFont(font)
-            else:
-                # If it only has one move, remove the entire item
-                self.move_list.takeItem(count - 1)
\ No newline at end of file
+        if self.model.rowCount() == 0:
+            return
+        if self.model.last_has_black_reply():
+            # Keep the row with White's move
+            self.model.set_black_reply(None)
+        else:
+            # If it only has one move, remove the entire row
+            self.model.remove_last_row()
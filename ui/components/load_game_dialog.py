@@ -15,6 +15,17 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon, QFont, QColor, QPixmap, QPainter
 
 
+# FEN piece letters to the solid Unicode glyph drawn in the preview
+_PREVIEW_GLYPHS = {
+    'K': '♚', 'Q': '♛', 'R': '♜', 'B': '♝', 'N': '♞', 'P': '♟',
+    'k': '♚', 'q': '♛', 'r': '♜', 'b': '♝', 'n': '♞', 'p': '♟'
+}
+
+# Light and dark square colors of the preview, indexed by (row + col) % 2
+_PREVIEW_SQUARE_COLORS = (QColor("#c1bfb0"), QColor("#7a9bbe"))
+# Drop shadow color of the dialog buttons
+_BUTTON_SHADOW_COLOR = QColor(0, 0, 0, 70)
+
 
 class LoadGameDialog(QDialog):
     """Enhanced dialog to load a saved chess game."""
@@ -112,7 +123,7 @@ class LoadGameDialog(QDialog):
         # Add drop shadow to the browse button
         button_shadow = QGraphicsDropShadowEffect(browse_button)
         button_shadow.setBlurRadius(15)
-        button_shadow.setColor(QColor(0, 0, 0, 70))
+        button_shadow.setColor(_BUTTON_SHADOW_COLOR)
         button_shadow.setOffset(0, 5)
         browse_button.setGraphicsEffect(button_shadow)
         
@@ -243,7 +254,7 @@ class LoadGameDialog(QDialog):
         for button in [self.load_button, cancel_button]:
             shadow = QGraphicsDropShadowEffect(button)
             shadow.setBlurRadius(15)
-            shadow.setColor(QColor(0, 0, 0, 70))
+            shadow.setColor(_BUTTON_SHADOW_COLOR)
             shadow.setOffset(0, 5)
             button.setGraphicsEffect(shadow)
         
@@ -274,12 +285,8 @@ class LoadGameDialog(QDialog):
             for col in range(8):
                 x = col * square_size
                 y = row * square_size
-                if (row + col) % 2 == 0:
-                    color = QColor("#c1bfb0")  # Light squares
-                else:
-                    color = QColor("#7a9bbe")  # Dark squares
-                
-                painter.fillRect(x, y, square_size, square_size, color)
+                painter.fillRect(x, y, square_size, square_size,
+                                 _PREVIEW_SQUARE_COLORS[(row + col) % 2])
         
         painter.end()
         
@@ -429,22 +436,14 @@ class LoadGameDialog(QDialog):
                         for col in range(8):
                             x = col * square_size
                             y = row * square_size
-                            if (row + col) % 2 == 0:
-                                color = QColor("#c1bfb0")  # Light squares
-                            else:
-                                color = QColor("#7a9bbe")  # Dark squares
-                            
-                            painter.fillRect(x, y, square_size, square_size, color)
+                            painter.fillRect(x, y, square_size, square_size,
+                                             _PREVIEW_SQUARE_COLORS[(row + col) % 2])
                     
                     # Draw pieces based on FEN
                     row = 0
                     col = 0
                     
-                    # Map FEN characters to Unicode chess pieces
-                    piece_map = {
-                        'K': '♚', 'Q': '♛', 'R': '♜', 'B': '♝', 'N': '♞', 'P': '♟',
-                        'k': '♚', 'q': '♛', 'r': '♜', 'b': '♝', 'n': '♞', 'p': '♟'
-                    }
+                    painter.setFont(QFont('Arial', int(square_size * 0.6)))
                     
                     for char in fen:
                         if char == '/':
@@ -452,7 +451,7 @@ class LoadGameDialog(QDialog):
                             col = 0
                         elif char.isdigit():
                             col += int(char)
-                        elif char in piece_map:
+                        elif char in _PREVIEW_GLYPHS:
                             x = col * square_size
                             y = row * square_size
                             
@@ -460,12 +459,10 @@ class LoadGameDialog(QDialog):
                             color = Qt.white if char.isupper() else Qt.black
                             
                             # Draw piece
-                            piece_font = QFont('Arial', int(square_size * 0.6))
-                            painter.setFont(piece_font)
                             painter.setPen(color)
                             painter.drawText(
                                 x, y, square_size, square_size, 
-                                Qt.AlignCenter, piece_map[char]
+                                Qt.AlignCenter, _PREVIEW_GLYPHS[char]
                             )
                             
                             col += 1
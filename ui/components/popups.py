@@ -15,6 +15,44 @@ from PyQt5.QtGui import QColor, QFont, QPixmap, QPainter, QPainterPath
 
 from utils.config import Config
 
+# Drop shadow color of the popup buttons
+_BUTTON_SHADOW_COLOR = QColor(0, 0, 0, 70)
+
+# Static styles live in resources/style.qss (see ChessApp); only the
+# result-colored GameOverPopup styles are built here.
+_GAME_OVER_BUTTON_TEMPLATE = """
+    QPushButton {
+        background-color: %s;
+        color: white;
+        font-size: 14pt;
+        font-weight: bold;
+        padding: 10px;
+        border-radius: 5px;
+        min-width: 150px;
+    }
+    QPushButton:hover {
+        background-color: #555555;
+    }
+"""
+
+
+def _game_over_styles(color):
+    """Return the (title, result, play again button) stylesheets for a result color."""
+    return (
+        "font-size: 24pt; font-weight: bold; color: %s;" % color,
+        "font-size: 20pt; font-weight: bold; color: %s; padding: 10px;" % color,
+        _GAME_OVER_BUTTON_TEMPLATE % color,
+    )
+
+
+# Result color -> prebuilt stylesheets for GameOverPopup
+_GAME_OVER_COLORS = {
+    "1-0": "#4CAF50",  # Green for white
+    "0-1": "#F44336",  # Red for black
+    "draw": "#2196F3",  # Blue for draw
+}
+_GAME_OVER_STYLES = {color: _game_over_styles(color) for color in _GAME_OVER_COLORS.values()}
+
 class BaseDialog(QDialog):
     """Base dialog class with common styling and functionality."""
     
@@ -27,24 +65,8 @@ class BaseDialog(QDialog):
         # Remove window decoration for custom styling
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         
-        # Set up base styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f5f5;
-                border-radius: 15px;
-                border: 2px solid #3498db;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-            QLineEdit, QTextEdit {
-                padding: 8px;
-                border-radius: 5px;
-                border: 1px solid #bdc3c7;
-                background-color: white;
-                font-size: 12pt;
-            }
-        """)
+        # Base styling comes from the application stylesheet
+        self.setObjectName("baseDialog")
         
         # Add shadow for depth
         shadow = QGraphicsDropShadowEffect(self)
@@ -65,12 +87,7 @@ class BaseDialog(QDialog):
         
         self.title_label = QLabel(title)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            font-size: 20pt;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        """)
+        self.title_label.setObjectName("dialogTitle")
         
         title_layout.addWidget(self.title_label)
         self.main_layout.addWidget(self.title_bar)
@@ -114,21 +131,11 @@ class BaseDialog(QDialog):
     
     def _lighten_color(self, color, factor=1.1):
         """Lighten a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = min(255, int(int(color[0:2], 16) * factor))
-        g = min(255, int(int(color[2:4], 16) * factor))
-        b = min(255, int(int(color[4:6], 16) * factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).lighter(round(factor * 100)).name()
     
     def _darken_color(self, color, factor=1.1):
         """Darken a hex color."""
-        if color.startswith('#'):
-            color = color[1:]
-        r = max(0, int(int(color[0:2], 16) / factor))
-        g = max(0, int(int(color[2:4], 16) / factor))
-        b = max(0, int(int(color[4:6], 16) / factor))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return QColor(color).darker(round(factor * 100)).name()
     
     def mousePressEvent(self, event):
         """Track mouse press events for window dragging."""
@@ -230,88 +237,34 @@ class StartScreen(BaseDialog):
         
         # Style title as chess title
         self.title_label.setText("♚ Chess Game ♔")
-        self.title_label.setStyleSheet("""
-            font-size: 36pt; 
-            font-weight: bold; 
-            margin-bottom: 30px; 
-            color: #2c3e50;
-        """)
+        self.title_label.setObjectName("startTitle")
         
         subtitle = QLabel("Select Game Mode:")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("font-size: 18pt; margin-bottom: 30px;")
+        subtitle.setObjectName("startSubtitle")
         self.content_layout.addWidget(subtitle)
         
         # Button container with attractive styling
         button_container = QWidget()
-        button_container.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border-radius: 15px;
-            }
-        """)
+        button_container.setObjectName("startButtons")
         buttons_layout = QVBoxLayout(button_container)
         buttons_layout.setSpacing(20)
         
         self.human_ai_button = QPushButton("Human vs AI")
         self.human_ai_button.setFixedHeight(70)
         self.human_ai_button.setCursor(Qt.PointingHandCursor)
-        self.human_ai_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-size: 18pt;
-                padding: 15px;
-                border-radius: 10px;
-                margin-bottom: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1c6ea4;
-            }
-        """)
+        self.human_ai_button.setObjectName("humanAiButton")
         
         self.ai_ai_button = QPushButton("AI vs AI")
         self.ai_ai_button.setFixedHeight(70)
         self.ai_ai_button.setCursor(Qt.PointingHandCursor)
-        self.ai_ai_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                font-size: 18pt;
-                padding: 15px;
-                border-radius: 10px;
-                margin-bottom: 10px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        self.ai_ai_button.setObjectName("aiAiButton")
         
         # Add Load Game button
         self.load_game_button = QPushButton("Load Saved Game")
         self.load_game_button.setFixedHeight(70)
         self.load_game_button.setCursor(Qt.PointingHandCursor)
-        self.load_game_button.setStyleSheet("""
-            QPushButton {
-                background-color: #16a085;
-                color: white;
-                font-size: 18pt;
-                padding: 15px;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1abc9c;
-            }
-            QPushButton:pressed {
-                background-color: #0e6655;
-            }
-        """)
+        self.load_game_button.setObjectName("loadGameButton")
         
         buttons_layout.addWidget(self.human_ai_button)
         buttons_layout.addWidget(self.ai_ai_button)
@@ -357,22 +310,23 @@ class PawnPromotionDialog(BaseDialog):
         # Instructions
         self.label = QLabel("Choose a piece to promote to:")
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setStyleSheet("font-size: 16pt; margin-bottom: 20px; color: #333;")
+        self.label.setObjectName("promotionLabel")
         self.content_layout.addWidget(self.label)
         
         # Create piece buttons
         piece_layout = QHBoxLayout()
         piece_layout.setSpacing(10)
         
+        # (name, UCI letter, symbol, color)
         piece_data = [
-            ("Queen", "♛", "#9c27b0"),  # Purple
-            ("Rook", "♜", "#f44336"),   # Red
-            ("Bishop", "♝", "#2196f3"), # Blue
-            ("Knight", "♞", "#4caf50")  # Green
+            ("Queen", "q", "♛", "#9c27b0"),  # Purple
+            ("Rook", "r", "♜", "#f44336"),   # Red
+            ("Bishop", "b", "♝", "#2196f3"), # Blue
+            ("Knight", "n", "♞", "#4caf50")  # Green
         ]
         
         self.piece_buttons = {}
-        for piece_name, symbol, color in piece_data:
+        for piece_name, letter, symbol, color in piece_data:
             piece_button = QPushButton(symbol)
             piece_button.setFixedSize(60, 60)
             piece_button.setCursor(Qt.PointingHandCursor)
@@ -397,13 +351,13 @@ class PawnPromotionDialog(BaseDialog):
             # Add shadow for depth
             shadow = QGraphicsDropShadowEffect(piece_button)
             shadow.setBlurRadius(15)
-            shadow.setColor(QColor(0, 0, 0, 70))
+            shadow.setColor(_BUTTON_SHADOW_COLOR)
             shadow.setOffset(0, 5)
             piece_button.setGraphicsEffect(shadow)
             
-            piece_button.clicked.connect(lambda _, p=piece_name.lower()[0]: self.select_piece(p))
+            piece_button.clicked.connect(lambda _, p=letter: self.select_piece(p))
             piece_layout.addWidget(piece_button)
-            self.piece_buttons[piece_name.lower()[0]] = piece_button
+            self.piece_buttons[letter] = piece_button
         
         self.content_layout.addLayout(piece_layout)
         
@@ -411,10 +365,10 @@ class PawnPromotionDialog(BaseDialog):
         labels_layout = QHBoxLayout()
         labels_layout.setSpacing(10)
         
-        for piece_name, _, _ in piece_data:
+        for piece_name, _, _, _ in piece_data:
             label = QLabel(piece_name)
             label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #333;")
+            label.setObjectName("promotionPieceLabel")
             labels_layout.addWidget(label)
         
         self.content_layout.addLayout(labels_layout)
@@ -447,12 +401,7 @@ class GameOverPopup(QDialog):
         self.setWindowTitle("Game Over")
         self.setModal(True)
         self.setFixedSize(400, 300)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f0f0f0;
-                border-radius: 10px;
-            }
-        """)
+        self.setObjectName("gameOverPopup")
         
         # Set up layout
         layout = QVBoxLayout(self)
@@ -462,38 +411,28 @@ class GameOverPopup(QDialog):
         # Use custom message if provided, otherwise determine based on result
         if custom_message:
             message = custom_message
-            result_color = "#F44336"  # Use red for resignation
+            result_color = _GAME_OVER_COLORS["0-1"]  # Use red for resignation
         else:
             # Determine the result message
             if result == '1-0':
                 message = "White Wins!"
-                result_color = "#4CAF50"  # Green for white
             elif result == '0-1':
                 message = "Black Wins!"
-                result_color = "#F44336"  # Red for black
             else:
                 message = "It's a Draw!"
-                result_color = "#2196F3"  # Blue for draw
+            result_color = _GAME_OVER_COLORS.get(result, _GAME_OVER_COLORS["draw"])
+        title_style, result_style, play_again_style = _GAME_OVER_STYLES[result_color]
         
         # Game over title
         title = QLabel("GAME OVER")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 24pt; 
-            font-weight: bold; 
-            color: {result_color}; 
-        """)
+        title.setStyleSheet(title_style)
         layout.addWidget(title)
         
         # Result message
         result_label = QLabel(message)
         result_label.setAlignment(Qt.AlignCenter)
-        result_label.setStyleSheet(f"""
-            font-size: 20pt; 
-            font-weight: bold; 
-            color: {result_color}; 
-            padding: 10px;
-        """)
+        result_label.setStyleSheet(result_style)
         layout.addWidget(result_label)
             
         # Add spacer
@@ -505,38 +444,12 @@ class GameOverPopup(QDialog):
         
         self.play_again_button = QPushButton("Play Again")
         self.play_again_button.setCursor(Qt.PointingHandCursor)
-        self.play_again_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {result_color};
-                color: white;
-                font-size: 14pt;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-                min-width: 150px;
-            }}
-            QPushButton:hover {{
-                background-color: #555555;
-            }}
-        """)
+        self.play_again_button.setStyleSheet(play_again_style)
         self.play_again_button.clicked.connect(self.play_again)
         
         self.return_home_button = QPushButton("Return to Home")
         self.return_home_button.setCursor(Qt.PointingHandCursor)
-        self.return_home_button.setStyleSheet("""
-            QPushButton {
-                background-color: #607D8B;
-                color: white;
-                font-size: 14pt;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #555555;
-            }
-        """)
+        self.return_home_button.setObjectName("returnHomeButton")
         self.return_home_button.clicked.connect(self.return_home)
         
         button_layout.addWidget(self.play_again_button)
@@ -634,7 +547,7 @@ class ResignConfirmationDialog(BaseDialog):
         for button in [resign_button, cancel_button]:
             shadow = QGraphicsDropShadowEffect(button)
             shadow.setBlurRadius(15)
-            shadow.setColor(QColor(0, 0, 0, 70))
+            shadow.setColor(_BUTTON_SHADOW_COLOR)
             shadow.setOffset(0, 5)
             button.setGraphicsEffect(shadow)
 
@@ -743,6 +656,6 @@ class ResignConfirmationDialog(BaseDialog):
         for button in [resign_button, cancel_button]:
             shadow = QGraphicsDropShadowEffect(button)
             shadow.setBlurRadius(10)  # Reduced blur for smaller buttons
-            shadow.setColor(QColor(0, 0, 0, 70))
+            shadow.setColor(_BUTTON_SHADOW_COLOR)
             shadow.setOffset(0, 4)  # Reduced offset for smaller buttons
             button.setGraphicsEffect(shadow)
\ No newline at end of file
@@ -8,7 +8,8 @@ import json
 import datetime
 from PyQt5.QtWidgets import (
     QScrollArea, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel, 
-    QFileDialog, QMessageBox, QSizePolicy, QGridLayout, QGraphicsDropShadowEffect
+    QFileDialog, QMessageBox, QSizePolicy, QGridLayout, QGraphicsDropShadowEffect,
+    QCheckBox
 )
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QColor
@@ -216,13 +217,7 @@ class AIControlPanel(QScrollArea):
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setStyleSheet("""
-            QScrollArea {
-                background-color: #2c3e50;
-                border-radius: 10px;
-                border: 2px solid #1a2530;
-            }
-        """)
+        self.setObjectName("controlPanel")
         
         # Add shadow for depth
         shadow = QGraphicsDropShadowEffect(self)
@@ -233,7 +228,7 @@ class AIControlPanel(QScrollArea):
         
         # Create inner widget for the scroll area
         inner_widget = QWidget()
-        inner_widget.setStyleSheet("background-color: #2c3e50;")  
+        inner_widget.setObjectName("controlPanelBody")
         self.setWidget(inner_widget)
         
         # Create main layout with moderate spacing
@@ -244,14 +239,7 @@ class AIControlPanel(QScrollArea):
         # Title header - will be updated based on mode
         self.title = QLabel("Game Controls")
         self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet("""
-            font-size: 16pt; 
-            font-weight: bold; 
-            color: white; 
-            padding: 8px;
-            background-color: #34495e;
-            border-radius: 6px;
-        """)
+        self.title.setObjectName("controlPanelTitle")
         self.main_layout.addWidget(self.title)
         
         # Create grid layout for more compact button arrangement
@@ -301,6 +289,12 @@ class AIControlPanel(QScrollArea):
         # Add the grid to the main layout
         self.main_layout.addWidget(button_grid)
         
+        # AI vs AI only: unticking it applies moves without the sliding piece
+        self.animate_checkbox = QCheckBox("Animate moves")
+        self.animate_checkbox.setChecked(True)
+        self.animate_checkbox.setObjectName("animateCheckbox")
+        self.main_layout.addWidget(self.animate_checkbox)
+        
         # Add a stretcher to push everything to the top
         self.main_layout.addStretch(1)
         
@@ -336,6 +330,7 @@ class AIControlPanel(QScrollArea):
         # Don't hide the buttons anymore - they're needed for timer control
         self.start_button.show()
         self.pause_button.show()
+        self.animate_checkbox.hide()
     
     def set_ai_ai_mode(self):
         """Configure the panel for AI vs AI mode."""
@@ -344,6 +339,7 @@ class AIControlPanel(QScrollArea):
         self.pause_button.setText("⏸ Pause AI Game")
         self.start_button.show()
         self.pause_button.show()
+        self.animate_checkbox.show()
     
     def sizeHint(self):
         """Provide a size hint for layout management."""
@@ -1,133 +1,290 @@
 """
 Multiprocessing AI Worker - COMPLETE NON-BLOCKING SOLUTION
-This completely separates AI computation from UI using separate processes.
+This completely separates AI computation from UI using a separate engine process.
 """
 
 import multiprocessing as mp
-import queue
+import threading
 import time
 import traceback
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
+from collections import OrderedDict
+from functools import partial
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
 
-def ai_worker_process(board_fen, depth, time_ms, result_queue, cancel_event, 
-                     white_time_ms=None, black_time_ms=None, white_inc_ms=None, black_inc_ms=None):
+# Number of searched positions remembered by ResponsiveAIManager
+MOVE_CACHE_SIZE = 4096
+
+def position_key(board_fen):
+    """Return the FEN without the halfmove and fullmove clocks."""
+    return " ".join(board_fen.split()[:4])
+
+def _watch_search(searcher, request_id, deadline, cancelled_id, done):
+    """Stop the search once its time is up or its request was cancelled.
+    
+    The watcher can fire before start_search() resets search_cancelled, so
+    it keeps the flag raised on every tick until the search has returned.
     """
-    AI computation function that runs in a separate process with smart time management.
+    stopping = False
+    while not done.wait(0.01):
+        if not stopping:
+            stopping = time.time() >= deadline or cancelled_id.value >= request_id
+        if stopping and not searcher.search_cancelled:
+            searcher.end_search()
+
+def engine_process_main(conn, parent_conn, cancelled_id):
     """
-    try:
-        # Import bot only in worker process to avoid conflicts
-        import sys
-        import os
+    Search loop of the long-lived engine process.
+    
+    The bot is built once, so its transposition table carries over from one
+    move to the next. Requests arrive on conn as tuples:
+    ("search", request_id, fen, time_ms, white_time_ms, black_time_ms,
+    white_inc_ms, black_inc_ms) is answered with a result dict,
+    ("clear",) forgets the previous game and None ends the loop.
+    """
+    # Drop the inherited GUI end so the loop sees EOF if the GUI goes away
+    parent_conn.close()
+    
+    # Import bot only in worker process to avoid conflicts
+    import sys
+    import os
+    
+    # Add project root to path
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(current_dir))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    from bot import ChessBot
+    
+    worker_bot = ChessBot(opening_book_path="resources/komodo.bin")
+    searcher = worker_bot.searcher
+    
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        if message[0] == "clear":
+            searcher.clear_for_new_position()
+            continue
         
-        # Add project root to path
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        if project_root not in sys.path:
-            sys.path.insert(0, project_root)
+        (_, request_id, board_fen, time_ms,
+         white_time_ms, black_time_ms, white_inc_ms, black_inc_ms) = message
+        # Cancelled while still queued behind an earlier search
+        if cancelled_id.value >= request_id:
+            conn.send({"id": request_id, "status": "cancelled", "move": None})
+            continue
+        try:
+            # set_fen keeps the board object the searcher and its table share
+            worker_bot.board.set_fen(board_fen)
+            
+            # Calculate optimal thinking time if time control parameters provided
+            if all(param is not None for param in [white_time_ms, black_time_ms, white_inc_ms, black_inc_ms]):
+                optimal_time = worker_bot.choose_think_time(
+                    white_time_ms, black_time_ms, white_inc_ms, black_inc_ms
+                )
+                # Use the smaller of requested time or optimal time
+                actual_time_ms = min(time_ms, optimal_time)
+                print(f"Smart time management: optimal={optimal_time}ms, using={actual_time_ms}ms")
+            else:
+                actual_time_ms = time_ms
+                print(f"Fixed time management: using={actual_time_ms}ms")
+            
+            # Search on this thread; the watcher only flags the searcher to stop,
+            # so the search has fully unwound before the next request is read
+            start_time = time.time()
+            done = threading.Event()
+            watcher = threading.Thread(
+                target=_watch_search,
+                args=(searcher, request_id, start_time + actual_time_ms / 1000.0, cancelled_id, done),
+                daemon=True
+            )
+            watcher.start()
+            try:
+                searcher.start_search()
+            finally:
+                done.set()
+            elapsed_time = time.time() - start_time
+            
+            best_move = searcher.best_move
+            if cancelled_id.value >= request_id:
+                conn.send({"id": request_id, "status": "cancelled", "move": None})
+            else:
+                conn.send({
+                    "id": request_id,
+                    "status": "success",
+                    "move": best_move.uci() if best_move else "",
+                    "time_taken": elapsed_time,
+                    "time_allocated": actual_time_ms
+                })
+        except Exception as e:
+            error_msg = f"AI Worker Error: {str(e)}\n{traceback.format_exc()}"
+            conn.send({"id": request_id, "status": "error", "error": error_msg})
+
+
+class EngineProcess:
+    """
+    Handle on the long-lived engine process, started on first use.
+    
+    Searches are tagged with increasing request ids; cancel() raises the
+    shared cancelled id so the process stops any search at or below it.
+    Replies are read through receive(), one thread at a time.
+    """
+    
+    def __init__(self):
+        self.process = None
+        self.conn = None
+        self.cancelled_id = mp.Value("i", 0)
+        self._send_lock = threading.Lock()
+        self._recv_lock = threading.Lock()
+        # Replies read by a worker waiting on an older request, by request id
+        self._replies = {}
         
-        from bot import ChessBot
-        from utils.config import Config
+    def is_alive(self):
+        """Check if the engine process is running."""
+        return self.process is not None and self.process.is_alive()
         
-        # Create bot instance in worker process
-        worker_bot = ChessBot(
-            initial_fen=board_fen,
-            opening_book_path="resources/komodo.bin"
-        )
+    def search(self, request_id, board_fen, time_ms,
+               white_time_ms=None, black_time_ms=None, white_inc_ms=None, black_inc_ms=None):
+        """Send a search request, starting the process if needed."""
+        if not self.is_alive():
+            self.start()
+        self._send(("search", request_id, board_fen, time_ms,
+                    white_time_ms, black_time_ms, white_inc_ms, black_inc_ms))
         
-        # Check for cancellation
-        if cancel_event.is_set():
-            result_queue.put({"status": "cancelled", "move": None})
-            return
+    def receive(self, request_id, timeout):
+        """Return the reply to request_id, or None if it has not come within timeout seconds.
         
-        # Calculate optimal thinking time if time control parameters provided
-        if all(param is not None for param in [white_time_ms, black_time_ms, white_inc_ms, black_inc_ms]):
-            optimal_time = worker_bot.choose_think_time(
-                white_time_ms, black_time_ms, white_inc_ms, black_inc_ms
-            )
-            # Use the smaller of requested time or optimal time
-            actual_time_ms = min(time_ms, optimal_time)
-            print(f"Smart time management: optimal={optimal_time}ms, using={actual_time_ms}ms")
-        else:
-            actual_time_ms = time_ms
-            print(f"Fixed time management: using={actual_time_ms}ms")
+        A cancelled worker may still be reading when the next one starts, so
+        a reply meant for a newer request is kept for its own worker instead
+        of being dropped. Replies to older requests are stale and discarded.
+        """
+        with self._recv_lock:
+            for stale_id in [reply_id for reply_id in self._replies if reply_id < request_id]:
+                del self._replies[stale_id]
+            reply = self._replies.pop(request_id, None)
+            if reply is not None:
+                return reply
+            
+            conn = self.conn
+            if conn is None or not conn.poll(timeout):
+                return None
+            reply = conn.recv()
+            if reply["id"] == request_id:
+                return reply
+            if reply["id"] > request_id:
+                self._replies[reply["id"]] = reply
+            return None
         
-        # Get best move with calculated time
-        start_time = time.time()
-        best_move = worker_bot.get_best_move(depth=depth, time_ms=actual_time_ms)
-        elapsed_time = time.time() - start_time
+    def cancel(self, request_id):
+        """Stop the search for request_id (and any older one)."""
+        with self.cancelled_id.get_lock():
+            if self.cancelled_id.value < request_id:
+                self.cancelled_id.value = request_id
         
-        # Check for cancellation before returning result
-        if cancel_event.is_set():
-            result_queue.put({"status": "cancelled", "move": None})
-        else:
-            result_queue.put({
-                "status": "success", 
-                "move": best_move,
-                "time_taken": elapsed_time,
-                "time_allocated": actual_time_ms
-            })
-            
-    except Exception as e:
-        error_msg = f"AI Worker Error: {str(e)}\n{traceback.format_exc()}"
-        result_queue.put({"status": "error", "error": error_msg})
+    def clear(self):
+        """Forget the transposition table, e.g. when starting a new game."""
+        if self.is_alive():
+            self._send(("clear",))
+        
+    def start(self):
+        """Start a fresh engine process."""
+        self.stop()
+        self._replies.clear()
+        self.conn, child_conn = mp.Pipe()
+        self.process = mp.Process(
+            target=engine_process_main, args=(child_conn, self.conn, self.cancelled_id), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        
+    def stop(self):
+        """Shut the engine process down."""
+        if self.process is None:
+            return
+        try:
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(timeout=2)
+                if self.process.is_alive():
+                    self.process.kill()
+            self.conn.close()
+        except Exception as e:
+            print(f"Error stopping AI process: {e}")
+        self.process = None
+        self.conn = None
+        
+    def _send(self, message):
+        with self._send_lock:
+            self.conn.send(message)
 
 
-class MultiprocessAIWorker(QThread):
+class WorkerSignals(QObject):
     """
-    Thread that manages a separate AI process with smart time management.
+    Signals of a MultiprocessAIWorker; a QRunnable cannot carry its own.
     """
     
     finished = pyqtSignal(str)  # Best move UCI
     error = pyqtSignal(str)     # Error message
     progress = pyqtSignal(int)  # Progress 0-100
+
+
+class MultiprocessAIWorker(QRunnable):
+    """
+    Pooled task that waits on the engine process for one move with smart time management.
+    """
     
-    def __init__(self, board_fen, depth, time_ms=10000, 
-                 white_time_ms=None, black_time_ms=None, white_inc_ms=None, black_inc_ms=None, parent=None):
-        super().__init__(parent)
+    def __init__(self, engine, request_id, board_fen, time_ms=10000, 
+                 white_time_ms=None, black_time_ms=None, white_inc_ms=None, black_inc_ms=None):
+        super().__init__()
+        # The manager keeps the worker until the next search replaces it
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.progress = self.signals.progress
+        # Set once run() returns
+        self.done = threading.Event()
+        self.engine = engine
+        self.request_id = request_id
         self.board_fen = board_fen
-        self.depth = depth
         self.time_ms = time_ms
         self.white_time_ms = white_time_ms
         self.black_time_ms = black_time_ms
         self.white_inc_ms = white_inc_ms
         self.black_inc_ms = black_inc_ms
-        self.ai_process = None
-        self.result_queue = None
-        self.cancel_event = None
         self._cancelled = False
         
     def run(self):
-        """Run AI computation in separate process with progress updates."""
+        """Send the position to the engine process and wait for its move with progress updates."""
         try:
-            # Create multiprocessing objects
-            self.result_queue = mp.Queue()
-            self.cancel_event = mp.Event()
+            # Cancelled while still queued in the pool
+            if self._cancelled:
+                self.finished.emit("")
+                return
             
             self.progress.emit(10)
             
-            # Start AI process with time management parameters
-            self.ai_process = mp.Process(
-                target=ai_worker_process,
-                args=(self.board_fen, self.depth, self.time_ms, 
-                      self.result_queue, self.cancel_event,
-                      self.white_time_ms, self.black_time_ms, 
-                      self.white_inc_ms, self.black_inc_ms)
+            self.engine.search(
+                self.request_id, self.board_fen, self.time_ms,
+                self.white_time_ms, self.black_time_ms,
+                self.white_inc_ms, self.black_inc_ms
             )
-            self.ai_process.start()
             
             self.progress.emit(20)
             
-            # Monitor process with progress updates
+            # Wait for the result with progress updates. Polling the pipe
+            # wakes up as soon as the move arrives instead of on the next check.
             start_time = time.time()
             timeout = (self.time_ms / 1000.0) + 10  # Add 10 second buffer
+            result = None
             
-            while self.ai_process.is_alive():
+            while result is None:
                 if self._cancelled:
-                    self.cancel_event.set()
-                    self.ai_process.terminate()
-                    self.ai_process.join(timeout=2)
-                    if self.ai_process.is_alive():
-                        self.ai_process.kill()
+                    # The engine stops the search itself; its late reply is
+                    # discarded by the next worker's receive()
                     self.finished.emit("")
                     return
                 
@@ -136,38 +293,32 @@ class MultiprocessAIWorker(QThread):
                 progress = min(90, 20 + int((elapsed / timeout) * 70))
                 self.progress.emit(progress)
                 
-                time.sleep(0.1)  # Check every 100ms
-                
-                # Timeout check
-                if elapsed > timeout:
-                    self.cancel_event.set()
-                    self.ai_process.terminate()
-                    self.ai_process.join(timeout=2)
-                    if self.ai_process.is_alive():
-                        self.ai_process.kill()
+                result = self.engine.receive(self.request_id, 0.1)  # Check every 100ms
+                if result is not None:
+                    break
+                if not self.engine.is_alive():
+                    self.error.emit("AI process finished but no result received")
+                    self.finished.emit("")
+                    return
+                elif elapsed > timeout:
+                    # The process is stuck; a fresh one starts with the next search
+                    self.engine.stop()
                     self.error.emit("AI computation timed out")
                     self.finished.emit("")
                     return
             
-            # Get result from queue
-            try:
-                result = self.result_queue.get(timeout=1)
-                self.progress.emit(100)
-                
-                if result["status"] == "success":
-                    move = result.get("move", "")
-                    time_taken = result.get("time_taken", 0)
-                    time_allocated = result.get("time_allocated", self.time_ms)
-                    print(f"AI found move: {move} (took {time_taken:.2f}s of {time_allocated/1000:.1f}s allocated)")
-                    self.finished.emit(move or "")
-                elif result["status"] == "error":
-                    self.error.emit(result.get("error", "Unknown AI error"))
-                    self.finished.emit("")
-                else:  # cancelled
-                    self.finished.emit("")
-                    
-            except queue.Empty:
-                self.error.emit("AI process finished but no result received")
+            self.progress.emit(100)
+            
+            if result["status"] == "success":
+                move = result.get("move", "")
+                time_taken = result.get("time_taken", 0)
+                time_allocated = result.get("time_allocated", self.time_ms)
+                print(f"AI found move: {move} (took {time_taken:.2f}s of {time_allocated/1000:.1f}s allocated)")
+                self.finished.emit(move or "")
+            elif result["status"] == "error":
+                self.error.emit(result.get("error", "Unknown AI error"))
+                self.finished.emit("")
+            else:  # cancelled
                 self.finished.emit("")
                 
         except Exception as e:
@@ -176,24 +327,16 @@ class MultiprocessAIWorker(QThread):
             self.error.emit(error_msg)
             self.finished.emit("")
         finally:
-            self.cleanup()
+            self.done.set()
+    
+    def is_running(self):
+        """Check if the worker has not finished yet."""
+        return not self.done.is_set()
     
     def cancel(self):
         """Cancel the AI computation."""
         self._cancelled = True
-        if self.cancel_event:
-            self.cancel_event.set()
-    
-    def cleanup(self):
-        """Clean up process resources."""
-        try:
-            if self.ai_process and self.ai_process.is_alive():
-                self.ai_process.terminate()
-                self.ai_process.join(timeout=2)
-                if self.ai_process.is_alive():
-                    self.ai_process.kill()
-        except Exception as e:
-            print(f"Error cleaning up AI process: {e}")
+        self.engine.cancel(self.request_id)
 
 
 class ResponsiveAIManager:
@@ -204,9 +347,22 @@ class ResponsiveAIManager:
     def __init__(self, parent=None):
         self.parent = parent
         self.current_worker = None
+        # Cancelled workers that have not returned yet. Auto-delete is off,
+        # so they are kept referenced here until their run() is done.
+        self._retired_workers = []
         self.progress_timer = QTimer()
         self.progress_timer.timeout.connect(self._update_progress)
         self._current_progress = 0
+        # Best moves already found, keyed by (position, depth), oldest first
+        self._move_cache = OrderedDict()
+        # Bumped on every cancel, so results queued by an abandoned search
+        # (or a pending cached reply) are dropped instead of delivered
+        self._request_id = 0
+        # One engine process serves every search, keeping its transposition table
+        self.engine = EngineProcess()
+        # Waiting on the engine reuses pooled threads instead of one new thread per move
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(2)
         
     def compute_move(self, board_fen, depth, time_ms, on_finished, on_error=None, on_progress=None,
                      white_time_ms=None, black_time_ms=None, white_inc_ms=None, black_inc_ms=None):
@@ -215,7 +371,8 @@ class ResponsiveAIManager:
         
         Args:
             board_fen (str): Current board position
-            depth (int): Search depth
+            depth (int): Requested depth; it only keys the move cache, as the
+                engine searches by time
             time_ms (int): Maximum time limit in milliseconds
             on_finished (callable): Callback when move is found
             on_error (callable): Callback for errors
@@ -227,22 +384,34 @@ class ResponsiveAIManager:
         """
         # Cancel any existing computation
         self.cancel_computation()
+        request_id = self._request_id
+        
+        # Reuse the answer if this position was already searched at this depth
+        key = (position_key(board_fen), depth)
+        cached_move = self._move_cache.get(key)
+        if cached_move:
+            self._move_cache.move_to_end(key)
+            print(f"AI move from cache: {cached_move}")
+            # Still deliver it asynchronously, like a real search
+            QTimer.singleShot(0, partial(self._deliver, request_id, on_finished, cached_move))
+            return
         
         # Create new worker with time management parameters
         self.current_worker = MultiprocessAIWorker(
-            board_fen, depth, time_ms,
+            self.engine, request_id, board_fen, time_ms,
             white_time_ms, black_time_ms, white_inc_ms, black_inc_ms
         )
         
         # Connect callbacks
-        self.current_worker.finished.connect(on_finished)
+        self.current_worker.finished.connect(partial(self._remember_move, key))
+        self.current_worker.finished.connect(partial(self._deliver, request_id, on_finished))
         if on_error:
-            self.current_worker.error.connect(on_error)
+            self.current_worker.error.connect(partial(self._deliver, request_id, on_error))
         if on_progress:
-            self.current_worker.progress.connect(on_progress)
+            self.current_worker.progress.connect(partial(self._deliver, request_id, on_progress))
         
         # Start computation
-        self.current_worker.start()
+        self.thread_pool.start(self.current_worker)
         
         time_info = f"depth={depth}, max_time={time_ms}ms"
         if white_time_ms is not None:
@@ -251,16 +420,42 @@ class ResponsiveAIManager:
         
     def cancel_computation(self):
         """Cancel any ongoing AI computation."""
-        if self.current_worker and self.current_worker.isRunning():
+        self._request_id += 1
+        self._retired_workers = [worker for worker in self._retired_workers if worker.is_running()]
+        if self.current_worker and self.current_worker.is_running():
+            # The worker notices within one poll interval; nothing waits for
+            # it here, and engine.receive() keeps it from taking the next reply
             self.current_worker.cancel()
-            self.current_worker.wait(1000)  # Wait up to 1 second
-            if self.current_worker.isRunning():
-                self.current_worker.terminate()
+            self._retired_workers.append(self.current_worker)
         self.current_worker = None
         
     def is_computing(self):
         """Check if AI is currently computing."""
-        return self.current_worker and self.current_worker.isRunning()
+        return self.current_worker and self.current_worker.is_running()
+        
+    def clear_cache(self):
+        """Forget all cached moves and the engine's table, e.g. when starting a new game."""
+        self._move_cache.clear()
+        self.engine.clear()
+        
+    def shutdown(self):
+        """Cancel any computation and stop the engine process."""
+        self.cancel_computation()
+        self.engine.stop()
+        
+    def _deliver(self, request_id, callback, value):
+        """Pass a worker result on, unless its request was cancelled since."""
+        if request_id == self._request_id:
+            callback(value)
+        
+    def _remember_move(self, key, move_uci):
+        """Store a successfully computed move in the cache."""
+        if not move_uci:
+            return
+        self._move_cache[key] = move_uci
+        self._move_cache.move_to_end(key)
+        if len(self._move_cache) > MOVE_CACHE_SIZE:
+            self._move_cache.popitem(last=False)
         
     def _update_progress(self):
         """Internal progress update (for smooth progress bars if needed)."""